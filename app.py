@@ -1,22 +1,94 @@
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import orjson
 from job_service import JobService
 from config import Config
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
 
 # Configure logging to show in Docker logs
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    stream=sys.stdout
-)
+# Log calls only enqueue the record; a listener thread formats and writes it to stdout
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)
+root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+log_listener.start()
+# Flush queued records on shutdown
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so every jsonify() call uses the C-accelerated encoder"""
+    def dumps(self, obj, **kwargs):
+        # Keep the default provider's output: sorted keys, non-string keys allowed, and
+        # datetimes handed to its default() so they stay HTTP dates instead of orjson's ISO-8601
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 job_service = JobService()
 
+# Webhook-triggered searches run here instead of a new thread per request
+# One worker is enough: a search that is already running is never started twice
+search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='jobsearch')
+_search_lock = threading.Lock()
+_search_in_flight = threading.Event()
+
+# Token bucket guarding /webhook/n8n: bursts of up to 5 calls, refilling one call per minute
+WEBHOOK_RATE = 1 / 60
+WEBHOOK_BURST = 5
+_webhook_bucket = {'tokens': float(WEBHOOK_BURST), 'ts': monotonic()}
+_webhook_bucket_lock = threading.Lock()
+
+def _allow_webhook_call():
+    """Take a token from the webhook bucket; False means the caller is over the rate limit"""
+    with _webhook_bucket_lock:
+        now = monotonic()
+        _webhook_bucket['tokens'] = min(WEBHOOK_BURST, _webhook_bucket['tokens'] + (now - _webhook_bucket['ts']) * WEBHOOK_RATE)
+        _webhook_bucket['ts'] = now
+        if _webhook_bucket['tokens'] >= 1:
+            _webhook_bucket['tokens'] -= 1
+            return True
+    return False
+
+def run_job_search():
+    """Run the daily job search in the background"""
+    try:
+        logger.info("Background job search started")
+        success = job_service.send_daily_jobs()
+        if success:
+            stats = job_service.get_stats()
+            logger.info(f"Background job search completed. Stats: {stats}")
+        else:
+            logger.warning("Background job search returned False")
+    except Exception as e:
+        logger.error(f"Error in background job search: {e}", exc_info=True)
+    finally:
+        job_service.db.remove_session()
+
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    """Release the request thread's database session"""
+    job_service.db.remove_session()
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
@@ -25,6 +97,11 @@ def health():
 @app.route('/webhook/n8n', methods=['POST'])
 def n8n_webhook():
     """Webhook endpoint for n8n to trigger job search"""
+    # Reject aggressive retries before any work is scheduled
+    if not _allow_webhook_call():
+        logger.warning("Webhook rate limit exceeded - rejecting call")
+        return jsonify({'error': 'rate_limited'}), 429
+    
     try:
         logger.info("Webhook called - starting job search in background")
         
@@ -34,22 +111,25 @@ def n8n_webhook():
         #     if secret != Config.N8N_WEBHOOK_SECRET:
         #         return jsonify({'error': 'Unauthorized'}), 401
         
-        # Run job search in background thread to avoid n8n timeout
-        def run_job_search():
-            try:
-                logger.info("Background job search started")
-                success = job_service.send_daily_jobs()
-                if success:
-                    stats = job_service.get_stats()
-                    logger.info(f"Background job search completed. Stats: {stats}")
-                else:
-                    logger.warning("Background job search returned False")
-            except Exception as e:
-                logger.error(f"Error in background job search: {e}", exc_info=True)
+        # The daily search is idempotent, so a call that arrives while one is running is skipped
+        with _search_lock:
+            if _search_in_flight.is_set():
+                logger.info("Job search already running - skipping this webhook call")
+                return jsonify({
+                    'status': 'already_running',
+                    'message': 'Job search is already running in background'
+                }), 202
+            _search_in_flight.set()
         
-        # Start background thread
-        thread = threading.Thread(target=run_job_search, daemon=True)
-        thread.start()
+        # Run job search in background worker to avoid n8n timeout
+        try:
+            future = search_executor.submit(run_job_search)
+        except Exception:
+            # Nothing was scheduled (e.g. the executor is shut down), so no callback will
+            # clear the flag - clear it here or every later call reports "already running"
+            _search_in_flight.clear()
+            raise
+        future.add_done_callback(lambda _: _search_in_flight.clear())
         
         # Return immediately to avoid n8n timeout
         return jsonify({
@@ -124,6 +204,7 @@ def debug_search():
     try:
         # Search without saving to see what's being found
         all_jobs = job_service.job_search.search_all_sources(Config.SERPAPI_KEY)
+        job_service.job_filter.preprocess(all_jobs)
         
         # Filter jobs
         filtered_jobs = job_service.job_filter.filter_jobs(all_jobs)
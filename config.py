@@ -1,8 +1,14 @@
 import os
+import sys
 from dotenv import load_dotenv
 
 load_dotenv()
 
+def _split(value, lower=True):
+    """Parse a comma-separated env value once into a tuple of stripped (and lowercased) entries"""
+    items = (item.strip() for item in value.split(','))
+    return tuple(sys.intern(item.lower() if lower else item) for item in items if item)
+
 class Config:
     # Telegram Bot Configuration
     TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
@@ -17,9 +23,10 @@ class Config:
     DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///jobs.db')
     
     # Job Search Configuration
-    SEARCH_KEYWORDS = os.getenv('SEARCH_KEYWORDS', 'devops engineer,sre,cloud engineer,devsecops').split(',')
-    EXPERIENCE_LEVELS = os.getenv('EXPERIENCE_LEVELS', 'junior,entry level,associate,0-3 years').split(',')
-    JOB_KEYWORDS = os.getenv('JOB_KEYWORDS', 'jenkins,aws,eks,github,github actions,git,docker,argocd,gitops,ci/cd,devops,pipeline,linux,python,bash').split(',')
+    # Parsed once at import into immutable tuples; empty entries (e.g. from a trailing comma) are dropped
+    SEARCH_KEYWORDS = _split(os.getenv('SEARCH_KEYWORDS', 'devops engineer,sre,cloud engineer,devsecops'))
+    EXPERIENCE_LEVELS = _split(os.getenv('EXPERIENCE_LEVELS', 'junior,entry level,associate,0-3 years'))
+    JOB_KEYWORDS = _split(os.getenv('JOB_KEYWORDS', 'jenkins,aws,eks,github,github actions,git,docker,argocd,gitops,ci/cd,devops,pipeline,linux,python,bash'))
     
     # n8n Webhook Configuration
     N8N_WEBHOOK_SECRET = os.getenv('N8N_WEBHOOK_SECRET', '')
@@ -29,8 +36,8 @@ class Config:
     # Default to Israel (includes on-site, hybrid, and remote jobs)
     # Searches major Israeli cities for on-site/hybrid jobs and "Remote" for remote positions
     # Can be overridden via SEARCH_LOCATIONS env var (comma-separated)
-    _locations = os.getenv('SEARCH_LOCATIONS', 'Israel,Tel Aviv,Jerusalem,Haifa,Remote')
-    SEARCH_LOCATIONS = [loc.strip() for loc in _locations.split(',')]
+    # Case is kept - locations are sent to SerpAPI and shown in messages as written
+    SEARCH_LOCATIONS = _split(os.getenv('SEARCH_LOCATIONS', 'Israel,Tel Aviv,Jerusalem,Haifa,Remote'), lower=False)
     
     @classmethod
     def validate(cls):
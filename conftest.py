@@ -0,0 +1,18 @@
+"""
+Shared pytest setup for the JobBot tests
+"""
+import importlib
+import pytest
+
+# Light modules nearly every test builds on; telegram_bot / job_search / job_service stay lazy
+WARM_MODULES = ("config", "database", "job_filter")
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_modules():
+    """Load the common application modules once, before the first test of the session"""
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # Left to test_imports to report; tests that need the module skip themselves
+            pass
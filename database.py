@@ -1,7 +1,11 @@
-from sqlalchemy import create_engine, Column, String, DateTime, Integer, Text, Boolean
+from sqlalchemy import create_engine, event, Column, String, DateTime, Integer, Text, Boolean, Index, text, select, insert, update, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from datetime import datetime, timedelta
+from sqlalchemy.orm import sessionmaker, scoped_session
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import hashlib
 import logging
 
@@ -9,6 +13,13 @@ logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the naive UTC timestamps stored in the jobs table"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+# Bump whenever Job.generate_job_id changes, so ids already stored get rehashed on startup
+JOB_ID_VERSION = 1
+
 class Job(Base):
     __tablename__ = 'jobs'
     
@@ -20,29 +31,103 @@ class Job(Base):
     url = Column(Text, nullable=False)
     description = Column(Text)
     source = Column(String)  # 'indeed', 'linkedin', 'glassdoor', etc.
-    posted_date = Column(DateTime)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    posted_date = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=utcnow, index=True)
     sent_to_telegram = Column(Boolean, default=False)
     sent_date = Column(DateTime)
     
+    __table_args__ = (
+        # Partial index for get_unsent_jobs - only covers jobs not yet sent to Telegram
+        Index('ix_unsent', 'sent_to_telegram', 'created_at', sqlite_where=text('sent_to_telegram = 0')),
+    )
+    
     def __repr__(self):
         return f"<Job(id={self.job_id}, title={self.title}, company={self.company})>"
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def generate_job_id(url, title, company):
-        """Generate a unique job ID from URL, title, and company"""
-        unique_string = f"{url}{title}{company}".lower()
-        return hashlib.md5(unique_string.encode()).hexdigest()
+        """Generate a unique job ID (32-char BLAKE2b-128 hex digest) from URL, title, and company"""
+        # Memoized: every search run re-scrapes mostly the same jobs, so their IDs repeat run after run
+        # Feed the parts to the hasher one by one instead of building a joined string
+        # Only title and company are normalized - URLs are already canonical
+        # errors='ignore' keeps malformed scraped text (e.g. lone surrogates) from raising;
+        # valid text encodes to the same bytes, so existing IDs are unchanged
+        h = hashlib.blake2b(digest_size=16)
+        h.update(url.encode('utf-8', 'ignore'))
+        h.update(b'\0')
+        h.update((title or '').lower().encode('utf-8', 'ignore'))
+        h.update(b'\0')
+        h.update((company or '').lower().encode('utf-8', 'ignore'))
+        return h.hexdigest()
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Tune each new SQLite connection for one background writer plus webhook/stats readers"""
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')  # readers no longer block the writer (and vice versa)
+    cursor.execute('PRAGMA synchronous=NORMAL')  # safe with WAL, avoids an fsync per commit
+    cursor.execute('PRAGMA mmap_size=67108864')  # 64 MB - read hot pages without read() syscalls
+    cursor.execute('PRAGMA cache_size=-20000')  # 20 MB page cache
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
 
 class Database:
-    def __init__(self, database_url):
-        self.engine = create_engine(database_url)
+    def __init__(self, database_url, **engine_kwargs):
+        """Connect to database_url; engine_kwargs (e.g. poolclass) are passed to create_engine over the defaults"""
+        url = make_url(database_url)
+        defaults = {}
+        if url.get_backend_name() == 'sqlite':
+            # The Flask request thread and the background job search thread share this engine
+            defaults['connect_args'] = {'check_same_thread': False, 'timeout': 30}
+        if url.database not in (None, '', ':memory:') and 'poolclass' not in engine_kwargs:
+            # Keep connections open and reuse them instead of reconnecting per call
+            # (in-memory SQLite uses a single-connection pool that takes no sizing options)
+            defaults.update(pool_size=5, max_overflow=10)
+        self.engine = create_engine(database_url, **{**defaults, **engine_kwargs})
+        if url.get_backend_name() == 'sqlite':
+            event.listen(self.engine, 'connect', _set_sqlite_pragmas)
         Base.metadata.create_all(self.engine)
-        self.Session = sessionmaker(bind=self.engine)
+        # create_all skips tables that already exist, so add any missing indexes to existing databases
+        for index in Job.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+        self._migrate_job_ids()
+        # One session per thread, reused across calls made from that thread
+        self.Session = scoped_session(sessionmaker(bind=self.engine))
     
     def get_session(self):
         return self.Session()
     
+    def _migrate_job_ids(self):
+        """Rehash stored job IDs created by an older generate_job_id, so known jobs are not re-sent"""
+        jobs_table = Job.__table__
+        # SQLite records the job ID version in PRAGMA user_version, so the rows are only read
+        # once per version bump; other databases have no such slot and are checked on every start
+        is_sqlite = self.engine.dialect.name == 'sqlite'
+        with self.engine.begin() as conn:
+            if is_sqlite:
+                version = conn.exec_driver_sql('PRAGMA user_version').scalar()
+                if version >= JOB_ID_VERSION:
+                    return
+            rows = conn.execute(select(jobs_table.c.id, jobs_table.c.job_id, jobs_table.c.url, jobs_table.c.title, jobs_table.c.company)).all()
+            # Only rows whose stored ID differs from the current hash need updating
+            stale = []
+            for row in rows:
+                new_job_id = Job.generate_job_id(row.url, row.title, row.company)
+                if new_job_id != row.job_id:
+                    stale.append({'row_id': row.id, 'new_job_id': new_job_id})
+            if stale:
+                logger.info(f"Rehashing {len(stale)} stored job IDs (job ID version {JOB_ID_VERSION})")
+                conn.execute(
+                    update(jobs_table).where(jobs_table.c.id == bindparam('row_id')).values(job_id=bindparam('new_job_id')),
+                    stale
+                )
+            if is_sqlite:
+                conn.exec_driver_sql(f'PRAGMA user_version = {JOB_ID_VERSION}')
+    
+    def remove_session(self):
+        """Dispose of the current thread's session (call when a request or background job finishes)"""
+        self.Session.remove()
+    
     def job_exists(self, job_id):
         """Check if a job already exists in the database"""
         session = self.get_session()
@@ -62,9 +147,6 @@ class Database:
                 job_data.get('company', '')
             )
             
-            if self.job_exists(job_id):
-                return None
-            
             job = Job(
                 job_id=job_id,
                 title=job_data.get('title', ''),
@@ -76,8 +158,13 @@ class Database:
                 posted_date=job_data.get('posted_date')
             )
             
+            # No job_exists() pre-check: the unique job_id index rejects duplicates
             session.add(job)
-            session.commit()
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                return None
             # Detach the job from the session before returning
             # This prevents "not bound to a Session" errors when accessing attributes later
             session.expunge(job)
@@ -91,6 +178,76 @@ class Database:
         finally:
             session.close()
     
+    def add_jobs_bulk(self, jobs_data):
+        """Add many jobs in a single transaction, skipping duplicates.
+        Returns (inserted rows with their job_id, number of jobs that failed to insert)"""
+        if not jobs_data:
+            return [], 0
+        # Keyed by job_id, keeping the first job of each: two sources can list the same
+        # URL/title pair, and the insert would only store it once
+        rows = {}
+        for job_data in jobs_data:
+            job_id = Job.generate_job_id(
+                job_data['url'],
+                job_data.get('title', ''),
+                job_data.get('company', '')
+            )
+            if job_id in rows:
+                continue
+            rows[job_id] = {
+                'job_id': job_id,
+                'title': job_data.get('title', ''),
+                'company': job_data.get('company', ''),
+                'location': job_data.get('location', ''),
+                'url': job_data['url'],
+                'description': job_data.get('description', ''),
+                'source': job_data.get('source', 'unknown'),
+                'posted_date': job_data.get('posted_date'),
+                'created_at': utcnow(),
+                'sent_to_telegram': False
+            }
+        rows = list(rows.values())
+        
+        try:
+            with self.engine.begin() as conn:
+                inserted = self._insert_rows(conn, rows)
+        except Exception as e:
+            # One bad row (e.g. a NOT NULL column left empty) rolls back the whole batch; insert
+            # the rows one by one instead, so only that row is lost and not the whole run
+            logger.warning(f"Bulk insert of {len(rows)} jobs failed ({e}), inserting them one by one")
+            inserted = set()
+            failed = 0
+            for row in rows:
+                try:
+                    with self.engine.begin() as conn:
+                        inserted |= self._insert_rows(conn, [row])
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"Error adding job {row['url'][:80]}: {e}", exc_info=True)
+            return [row for row in rows if row['job_id'] in inserted], failed
+        return [row for row in rows if row['job_id'] in inserted], 0
+    
+    def _insert_rows(self, conn, rows):
+        """Insert job rows on conn, skipping job IDs already stored. Returns the inserted job IDs"""
+        jobs_table = Job.__table__
+        if self.engine.dialect.name == 'sqlite':
+            # INSERT OR IGNORE: the unique job_id index does the deduplication, no SELECT per job;
+            # RETURNING reports which rows were actually inserted
+            statement = (
+                sqlite_insert(jobs_table)
+                .on_conflict_do_nothing(index_elements=['job_id'])
+                .returning(jobs_table.c.job_id)
+            )
+            return set(conn.execute(statement, rows).scalars())
+        # No portable ON CONFLICT: look the job IDs up in one query and insert the rest
+        existing = set(conn.execute(
+            select(jobs_table.c.job_id).where(jobs_table.c.job_id.in_([row['job_id'] for row in rows]))
+        ).scalars())
+        new_rows = [row for row in rows if row['job_id'] not in existing]
+        if new_rows:
+            conn.execute(insert(jobs_table), new_rows)
+        return {row['job_id'] for row in new_rows}
+    
     def get_unsent_jobs(self, date=None):
         """Get jobs that haven't been sent to Telegram"""
         session = self.get_session()
@@ -111,7 +268,7 @@ class Database:
             job = session.query(Job).filter(Job.job_id == job_id).first()
             if job:
                 job.sent_to_telegram = True
-                job.sent_date = datetime.utcnow()
+                job.sent_date = utcnow()
                 session.commit()
         except Exception as e:
             session.rollback()
@@ -119,11 +276,26 @@ class Database:
         finally:
             session.close()
     
+    def mark_jobs_as_sent_bulk(self, job_ids):
+        """Mark many jobs as sent to Telegram with a single UPDATE"""
+        if not job_ids:
+            return
+        statement = (
+            update(Job.__table__)
+            .where(Job.__table__.c.job_id.in_(job_ids))
+            .values(sent_to_telegram=True, sent_date=utcnow())
+        )
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(statement)
+        except Exception as e:
+            logger.error(f"Error marking jobs as sent in bulk: {e}", exc_info=True)
+    
     def get_today_jobs_count(self):
         """Get count of jobs added today"""
         session = self.get_session()
         try:
-            today = datetime.utcnow().date()
+            today = utcnow().date()
             count = session.query(Job).filter(
                 Job.created_at >= datetime.combine(today, datetime.min.time())
             ).count()
@@ -135,7 +307,7 @@ class Database:
         """Get jobs from the last N days, formatted for Telegram"""
         session = self.get_session()
         try:
-            cutoff = datetime.utcnow() - timedelta(days=days)
+            cutoff = utcnow() - timedelta(days=days)
             jobs = session.query(Job).filter(
                 Job.posted_date >= cutoff
             ).order_by(Job.posted_date.desc()).limit(limit).all()
@@ -1,77 +1,152 @@
 import re
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Sequence
+from datetime import datetime, timedelta, timezone
+from dateutil import parser as _dateparser
 import logging
 
+try:
+    import ahocorasick
+except ImportError:  # optional - keyword matching falls back to the fused regex
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# A single regex word character - used to check \b-style boundaries around literal keyword hits
+_WORD_CHAR = re.compile(r'\w')
+
+def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+    """Check that text[start:end] has the same word boundaries on both sides a \\b...\\b regex would require"""
+    return (start == 0 or not _WORD_CHAR.match(text[start - 1])) and \
+        (end == len(text) or not _WORD_CHAR.match(text[end]))
+
+# Experience level indicators in English
+ENGLISH_EXPERIENCE_PATTERNS = [
+    r'\b(junior|jr\.?|entry\s*level|associate|intern|internship)\b',
+    r'\b(0\s*-\s*[0-3])\s*years?\b',
+    r'\b([0-3])\s*-\s*([0-3])\s*years?\b',  # e.g., "1-2 years", "0-3 years"
+    r'\b([0-3])\s*years?\b',  # e.g., "1 year", "2 years", "3 years"
+    r'\b([0-3])\s*\+\s*years?\b'  # e.g., "2+ years" but max 3
+]
+
+# Experience in Hebrew (שנים = years)
+HEBREW_EXPERIENCE_PATTERNS = [
+    r'\b(0\s*-\s*[0-3])\s*שנים\b',  # "0-3 שנים"
+    r'\b([0-3])\s*-\s*([0-3])\s*שנים\b',  # "1-2 שנים", "0-3 שנים"
+    r'\b([0-3])\s*שנים\b',  # "1 שנים", "2 שנים"
+    r'\b(ג\'וניור|ג\'וניורית|זוטר|זוטרה|בוגר|בוגרת|מתחיל|מתחילה)\b',  # Hebrew: junior, entry level
+]
+
+# Explicit "no experience required" (e.g., "לא נדרש ניסיון" = no experience required)
+NO_EXPERIENCE_PATTERNS = [
+    r'\b(no\s*experience|לא\s*נדרש\s*ניסיון|ללא\s*ניסיון)\b',
+    r'\b(entry\s*level|מתחיל)\b'
+]
+
+# Explicit senior/4+ years requirements (exclude these)
+SENIOR_KEYWORD_PATTERN = r'\b(senior|sr\.?|lead|principal|architect|מנהל|מנהלת|מוביל|מובילה)\b'
+SENIOR_YEARS_PATTERNS = [
+    r'\b([4-9]|\d{2,})\s*(?:\+)?\s*(?:years?|yrs?|שנים)\b',  # 4+ years, 5 years, etc.
+    r'\b([4-9]|\d{2,})\s*-\s*\d+\s*(?:years?|yrs?|שנים)\b',  # 4-5 years, 5-7 years, etc.
+]
+
 class JobFilter:
-    def __init__(self, experience_levels: List[str], keywords: List[str]):
+    def __init__(self, experience_levels: Sequence[str], keywords: Sequence[str]):
         self.experience_levels = [level.lower() for level in experience_levels]
         self.keywords = [keyword.lower() for keyword in keywords]
+        
+        # Compile all patterns once - filter_job runs them for every job
+        # No re.IGNORECASE: patterns only ever run against the already-lowercased search text
+        self._english_exp_res = [re.compile(p) for p in ENGLISH_EXPERIENCE_PATTERNS]
+        self._hebrew_exp_res = [re.compile(p) for p in HEBREW_EXPERIENCE_PATTERNS]
+        self._no_exp_re = re.compile('|'.join(f'(?:{p})' for p in NO_EXPERIENCE_PATTERNS))
+        self._senior_re = re.compile(SENIOR_KEYWORD_PATTERN)
+        # Kept as separate patterns (not one alternation) so each is still checked in order
+        self._senior_years_res = [re.compile(p) for p in SENIOR_YEARS_PATTERNS]
+        self._year_re = re.compile(r'(\d+)\s*(?:year|yr|שנים)')
+        self._number_re = re.compile(r'\d+')
+        # Plain substring scan over all experience levels in a single pass
+        self._experience_level_re = re.compile('|'.join(re.escape(level) for level in self.experience_levels)) if self.experience_levels else None
+        # Plain literal keywords (jenkins, aws, docker, ...) skip the regex engine entirely:
+        # an Aho-Corasick automaton finds all of them in one linear pass when pyahocorasick is installed,
+        # otherwise each one is located with str.find and its word boundaries checked by hand
+        self._literal_keywords = [keyword.strip() for keyword in self.keywords if self._is_literal_keyword(keyword)]
+        regex_keywords = [keyword for keyword in self.keywords if not self._is_literal_keyword(keyword)]
+        self._keyword_automaton = None
+        if ahocorasick is not None and self._literal_keywords:
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword in self._literal_keywords:
+                self._keyword_automaton.add_word(keyword, keyword)
+            self._keyword_automaton.make_automaton()
+        
+        # Remaining keywords fused into one alternation - one scan of the text instead of one per keyword
+        # Each keyword gets a named group (k0, k1, ...) so a match can be traced back to its keyword
+        self._keyword_by_group = {f'k{i}': keyword for i, keyword in enumerate(regex_keywords)}
+        keyword_parts = [f'(?P<{group}>{self._get_keyword_pattern(keyword)})' for group, keyword in self._keyword_by_group.items()]
+        self._keyword_re = re.compile('|'.join(keyword_parts)) if keyword_parts else None
+    
+    def preprocess(self, jobs: List[Dict]) -> List[Dict]:
+        """Attach the lowercased search text and parsed posted date to each job, so later stages don't redo them"""
+        for job in jobs:
+            self._get_search_text(job)
+            job['_posted_dt'] = self._parse_posted_date(job.get('posted_date'))
+        return jobs
     
     def filter_job(self, job: Dict) -> bool:
         """Check if a job matches all filtering criteria"""
-        # Combine title, description, and company for filtering
-        text_to_search = ' '.join([
-            job.get('title', ''),
-            job.get('description', ''),
-            job.get('company', '')
-        ]).lower()
+        text_to_search = self._get_search_text(job)
+        
+        # Check keywords first - it is the cheaper check and rejects most off-topic jobs
+        keyword_match = self._matches_keywords(text_to_search)
+        if not keyword_match:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Job '{job.get('title', '')[:50]}' filtered out: insufficient keywords match")
+            return False
         
         # Check experience level
         experience_match = self._matches_experience(text_to_search)
         if experience_match is False:
             # Explicitly excluded (senior/4+ years)
-            logger.debug(f"Job '{job.get('title', '')[:50]}' filtered out: experience requirement not met (senior/4+ years)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Job '{job.get('title', '')[:50]}' filtered out: experience requirement not met (senior/4+ years)")
             return False
         # If experience_match is None (ambiguous/not found), don't block it
-        # If experience_match is True (junior/0-3), continue to keyword check
-        
-        # Check keywords
-        keyword_match = self._matches_keywords(text_to_search)
-        if not keyword_match:
-            logger.debug(f"Job '{job.get('title', '')[:50]}' filtered out: insufficient keywords match")
-            return False
+        # If experience_match is True (junior/0-3), the job passes
         
         return True
     
+    def _get_search_text(self, job: Dict) -> str:
+        """Get the lowercased title + description + company text of a job, building it only once per job"""
+        text = job.get('_search_text')
+        if text is None:
+            # Combine title, description, and company for filtering
+            text = ' '.join([
+                job.get('title', ''),
+                job.get('description', ''),
+                job.get('company', '')
+            ]).lower()
+            # Cache on the job so later passes over the same job reuse it
+            job['_search_text'] = text
+        return text
+    
     def _matches_experience(self, text: str) -> Optional[bool]:
-        """Check if job text matches experience level requirements (0-3 years, junior, entry level)"""
-        # Check for experience level indicators in English
-        experience_patterns = [
-            r'\b(junior|jr\.?|entry\s*level|associate|intern|internship)\b',
-            r'\b(0\s*-\s*[0-3])\s*years?\b',
-            r'\b([0-3])\s*-\s*([0-3])\s*years?\b',  # e.g., "1-2 years", "0-3 years"
-            r'\b([0-3])\s*years?\b',  # e.g., "1 year", "2 years", "3 years"
-            r'\b([0-3])\s*\+\s*years?\b'  # e.g., "2+ years" but max 3
-        ]
-        
-        # Check for experience in Hebrew (שנים = years)
-        hebrew_patterns = [
-            r'\b(0\s*-\s*[0-3])\s*שנים\b',  # "0-3 שנים"
-            r'\b([0-3])\s*-\s*([0-3])\s*שנים\b',  # "1-2 שנים", "0-3 שנים"
-            r'\b([0-3])\s*שנים\b',  # "1 שנים", "2 שנים"
-            r'\b(ג\'וניור|ג\'וניורית|זוטר|זוטרה|בוגר|בוגרת|מתחיל|מתחילה)\b',  # Hebrew: junior, entry level
-        ]
-        
+        """Check if lowercased job text matches experience level requirements (0-3 years, junior, entry level)"""
         # Check English patterns
-        for pattern in experience_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._english_exp_res:
+            match = pattern.search(text)
             if match:
                 # Verify the number is within 0-3 range
-                numbers = re.findall(r'\d+', match.group(0))
+                numbers = self._number_re.findall(match.group(0))
                 if numbers:
                     max_years = max(int(n) for n in numbers if n.isdigit())
                     if max_years <= 3:
                         return True
         
         # Check Hebrew patterns
-        for pattern in hebrew_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self._hebrew_exp_res:
+            match = pattern.search(text)
             if match:
                 # Verify the number is within 0-3 range
-                numbers = re.findall(r'\d+', match.group(0))
+                numbers = self._number_re.findall(match.group(0))
                 if numbers:
                     max_years = max(int(n) for n in numbers if n.isdigit())
                     if max_years <= 3:
@@ -81,71 +156,68 @@ class JobFilter:
                     return True
         
         # Check if any experience level keyword is in the text
-        for level in self.experience_levels:
-            if level.lower() in text.lower():
-                return True
+        if self._experience_level_re and self._experience_level_re.search(text):
+            return True
         
-        # Check for explicit exclusion of higher experience (e.g., "לא נדרש ניסיון" = no experience required)
-        no_experience_patterns = [
-            r'\b(no\s*experience|לא\s*נדרש\s*ניסיון|ללא\s*ניסיון)\b',
-            r'\b(entry\s*level|מתחיל)\b'
-        ]
-        for pattern in no_experience_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
+        # Check for explicit exclusion of higher experience
+        if self._no_exp_re.search(text):
+            return True
         
         # Check for explicit senior/4+ years requirements (exclude these)
-        senior_patterns = [
-            r'\b(senior|sr\.?|lead|principal|architect|מנהל|מנהלת|מוביל|מובילה)\b',
-            r'\b([4-9]|\d{2,})\s*(?:\+)?\s*(?:years?|yrs?|שנים)\b',  # 4+ years, 5 years, etc.
-            r'\b([4-9]|\d{2,})\s*-\s*\d+\s*(?:years?|yrs?|שנים)\b',  # 4-5 years, 5-7 years, etc.
-        ]
-        for pattern in senior_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if self._senior_re.search(text):
+            return False  # Explicitly exclude senior positions
+        for pattern in self._senior_years_res:
+            match = pattern.search(text)
             if match:
-                # For senior keywords, exclude immediately
-                if re.search(r'\b(senior|sr\.?|lead|principal|architect|מנהל|מנהלת|מוביל|מובילה)\b', match.group(0), re.IGNORECASE):
-                    return False  # Explicitly exclude senior positions
                 # For year patterns, check the numbers
-                year_numbers = re.findall(r'(\d+)', match.group(0))
+                year_numbers = self._number_re.findall(match.group(0))
                 if year_numbers:
                     min_years = min(int(n) for n in year_numbers if n.isdigit())
                     if min_years >= 4:
                         return False  # Explicitly exclude senior/4+ years
         
         # Check if experience requirements are mentioned at all
-        has_experience_mention = re.search(r'\d+\s*(year|yr|שנים)', text, re.IGNORECASE)
-        if has_experience_mention:
-            # Extract all year numbers
-            year_numbers = re.findall(r'(\d+)\s*(?:year|yr|שנים)', text, re.IGNORECASE)
-            if year_numbers:
-                max_years_mentioned = max(int(n) for n in year_numbers if n.isdigit())
-                if max_years_mentioned > 3:
-                    return False  # Explicitly exclude jobs requiring more than 3 years
+        year_numbers = self._year_re.findall(text)
+        if year_numbers:
+            max_years_mentioned = max(int(n) for n in year_numbers if n.isdigit())
+            if max_years_mentioned > 3:
+                return False  # Explicitly exclude jobs requiring more than 3 years
         
         # If no experience mentioned or ambiguous, return None (don't block it)
         return None
     
     def _matches_keywords(self, text: str) -> bool:
-        """Check if job text contains at least some of the required keywords"""
-        matched_keywords = 0
-        min_keywords_required = 1
-        matched_list = []
-        
-        for keyword in self.keywords:
-            # Handle special cases
-            keyword_pattern = self._get_keyword_pattern(keyword)
-            if re.search(keyword_pattern, text, re.IGNORECASE):
-                matched_keywords += 1
-                matched_list.append(keyword)
-        
-        if matched_keywords >= min_keywords_required:
-            return True
+        """Check if lowercased job text contains at least one of the required keywords"""
+        return self._matched_keyword(text) is not None
+    
+    def _matched_keyword(self, text: str) -> Optional[str]:
+        """Return the first keyword found in the job text, or None if no keyword matches"""
+        if self._keyword_automaton is not None:
+            for end, keyword in self._keyword_automaton.iter(text):
+                if _at_word_boundaries(text, end - len(keyword) + 1, end + 1):
+                    return keyword
         else:
-            # Debug: show which keywords matched and which didn't
-            if matched_keywords > 0:
-                logger.debug(f"  Only {matched_keywords} keyword(s) matched: {matched_list} (need {min_keywords_required})")
+            for keyword in self._literal_keywords:
+                start = text.find(keyword)
+                while start >= 0:
+                    if _at_word_boundaries(text, start, start + len(keyword)):
+                        return keyword
+                    # e.g. 'git' inside 'gitlab' - keep looking further on
+                    start = text.find(keyword, start + 1)
+        if not self._keyword_re:
+            return None
+        # One match is enough, so stop at the first hit of the fused pattern
+        match = self._keyword_re.search(text)
+        if not match:
+            return None
+        return self._keyword_by_group[match.lastgroup]
+    
+    def _is_literal_keyword(self, keyword: str) -> bool:
+        """Check if a keyword is matched as a plain word (no special-case pattern, word characters at both ends)"""
+        keyword = keyword.strip()
+        if not keyword or self._get_keyword_pattern(keyword) != rf'\b{re.escape(keyword)}\b':
             return False
+        return bool(_WORD_CHAR.match(keyword[0]) and _WORD_CHAR.match(keyword[-1]))
     
     def _get_keyword_pattern(self, keyword: str) -> str:
         """Get regex pattern for a keyword, handling special cases"""
@@ -175,9 +247,24 @@ class JobFilter:
                 filtered_jobs.append(job)
         return filtered_jobs
     
+    def _parse_posted_date(self, posted_date) -> Optional[datetime]:
+        """Convert a job's posted_date (datetime or string) to a datetime, or None if it can't be parsed"""
+        if isinstance(posted_date, datetime):
+            return posted_date
+        if isinstance(posted_date, str):
+            # Try to parse string date - ISO-8601 via the much faster stdlib parser first
+            try:
+                return datetime.fromisoformat(posted_date)
+            except ValueError:
+                try:
+                    return _dateparser.parse(posted_date)
+                except (ValueError, OverflowError):
+                    return None
+        return None
+    
     def get_jobs_from_today(self, jobs: List[Dict], days_back: int = 0) -> List[Dict]:
         """Filter jobs posted in the last 72 hours (rolling window)"""
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
         # Calculate cutoff time: 72 hours ago (3 days)
         # If days_back is provided, use that instead
         if days_back > 0:
@@ -186,61 +273,49 @@ class JobFilter:
             cutoff_time = now - timedelta(hours=72)
         
         recent_jobs = []
-        jobs_with_dates = 0
         jobs_without_dates = 0
-        jobs_in_last_24h = 0
-        jobs_older_than_24h = 0
+        jobs_unparsed_dates = 0
+        jobs_in_window = 0
+        jobs_older_than_window = 0
+        # Per-job lines are only built when debug logging is on; counters feed one summary line
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         for job in jobs:
             posted_date = job.get('posted_date')
-            if posted_date:
-                jobs_with_dates += 1
-                job_datetime = None
-                if isinstance(posted_date, datetime):
-                    job_datetime = posted_date
-                elif isinstance(posted_date, str):
-                    # Try to parse string date
-                    try:
-                        from dateutil import parser
-                        job_datetime = parser.parse(posted_date)
-                    except:
-                        pass
-                
-                if job_datetime:
-                    # Check if job was posted within the last 24 hours
-                    time_diff = now - job_datetime
-                    hours_ago = time_diff.total_seconds() / 3600
-                    
-                    if job_datetime >= cutoff_time:
-                        # Job was posted within last 24 hours - include it
-                        jobs_in_last_24h += 1
-                        recent_jobs.append(job)
-                    elif days_back > 0:
-                        # If days_back > 0, include jobs from the last N days
-                        cutoff_date = now - timedelta(days=days_back)
-                        if job_datetime >= cutoff_date:
-                            recent_jobs.append(job)
-                        else:
-                            jobs_older_than_24h += 1
-                    else:
-                        # Job is older than 72 hours - exclude it
-                        jobs_older_than_24h += 1
-                        logger.debug(f"Excluding job '{job.get('title', '')[:50]}' - posted {hours_ago:.1f} hours ago (older than 72h)")
-                else:
-                    # Could not parse datetime, but we have a posted_date value
-                    # Be lenient and include it (might be a parsing issue)
-                    logger.info(f"Including job '{job.get('title', '')[:50]}' - could not parse date: {posted_date}")
-                    recent_jobs.append(job)
-            else:
+            if not posted_date:
                 # If no date available, be lenient and include it
                 # This is important because web scraping might not always parse dates correctly
                 # We'll include jobs without dates to avoid missing recent jobs
                 jobs_without_dates += 1
-                source = job.get('source', '')
-                logger.info(f"Including job '{job.get('title', '')[:50]}' from {source} - no date available (assuming recent)")
+                if debug_enabled:
+                    logger.debug(f"Including job '{job.get('title', '')[:50]}' from {job.get('source', '')} - no date available (assuming recent)")
                 recent_jobs.append(job)
+                continue
+            
+            # Reuse the date parsed by preprocess() when available
+            if '_posted_dt' in job:
+                job_datetime = job['_posted_dt']
+            else:
+                job_datetime = self._parse_posted_date(posted_date)
+            if job_datetime is None:
+                # Could not parse datetime, but we have a posted_date value
+                # Be lenient and include it (might be a parsing issue)
+                jobs_unparsed_dates += 1
+                if debug_enabled:
+                    logger.debug(f"Including job '{job.get('title', '')[:50]}' - could not parse date: {posted_date}")
+                recent_jobs.append(job)
+            elif job_datetime >= cutoff_time:
+                # Job was posted within the window - include it
+                jobs_in_window += 1
+                recent_jobs.append(job)
+            else:
+                # Job is older than the window - exclude it
+                jobs_older_than_window += 1
+                if debug_enabled:
+                    hours_ago = (now - job_datetime).total_seconds() / 3600
+                    logger.debug(f"Excluding job '{job.get('title', '')[:50]}' - posted {hours_ago:.1f} hours ago (older than cutoff)")
         
-        logger.info(f"Date filtering (last 72h): {jobs_with_dates} with dates, {jobs_without_dates} without dates, {jobs_in_last_24h} in last 72h, {jobs_older_than_24h} older than 72h")
+        jobs_with_dates = len(jobs) - jobs_without_dates
+        logger.info(f"Date filtering (last 72h): {jobs_with_dates} with dates, {jobs_without_dates} without dates (included), {jobs_unparsed_dates} with unparseable dates (included), {jobs_in_window} in last 72h, {jobs_older_than_window} older than 72h")
         logger.info(f"Total jobs after date filtering: {len(recent_jobs)}")
         return recent_jobs
-
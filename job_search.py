@@ -1,346 +1,629 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import feedparser
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+import orjson
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from bs4.builder import ParserRejectedMarkup
+from lxml import etree
+import soupsieve
+from datetime import datetime, timedelta, timezone
+import threading
 import time
 import re
-from typing import List, Dict, Optional
-from urllib.parse import quote, urlencode
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, List, Dict, Optional, Sequence, Set, Tuple
+from urllib.parse import quote_plus
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent search calls to a single host from search_all_sources. This is the
+# only client-side rate guard: 429s are waited out by HTTP_RETRY per Retry-After
+HOST_CONCURRENCY = 2
+
+# Longest Retry-After wait honoured, in seconds. A retry sleeps in the worker thread while
+# holding its host slot, so a server asking for minutes would stall the whole search
+RETRY_AFTER_MAX = 30
+
+class _CappedRetry(Retry):
+    """Retry that waits out Retry-After for at most RETRY_AFTER_MAX seconds"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
+
+# Retry policy mounted on the shared session: connection errors and 429/5xx responses are
+# retried with exponential backoff, waiting out Retry-After (capped) when the server sends one.
+# The last response is returned instead of raised so callers keep their status handling
+HTTP_RETRY = _CappedRetry(
+    total=3,
+    backoff_factor=1,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Successful response bodies are reused for this many seconds, so repeated terms in one
+# run and back-to-back scheduled runs skip the network; older entries are evicted first
+RESPONSE_CACHE_TTL = 900
+RESPONSE_CACHE_SIZE = 256
+
+# Every page is parsed with lxml; bind the parser once instead of naming it at each call site
+_SOUP = partial(BeautifulSoup, features='lxml')
+
+# Job detail pages are only queried for headings, title/meta tags and the text blocks
+# below, so skip building everything else (scripts, styles, nav, tracking markup)
+DETAIL_PAGE_STRAINER = SoupStrainer(['h1', 'h2', 'title', 'meta', 'span', 'div', 'section', 'p', 'a', 'time'])
+
+# Listing/detail page patterns, compiled once at import instead of on every lookup
+_RE_JOB_HREF_WITH_HASH = re.compile(r'/job/\d+/\w+/')
+_RE_JOB_HREF = re.compile(r'/job/\d+(/\w+/)?')
+_RE_GOTFRIENDS_HREF = re.compile(r'/job/|/position/|/jobs/')
+_RE_TITLE = re.compile(r'title|job|position|name', re.I)
+_RE_COMPANY = re.compile(r'company|employer|חברה', re.I)
+_RE_LISTING_COMPANY = re.compile(r'company|employer', re.I)
+_RE_COMPANY_NAME = re.compile(r'([A-Z][a-zA-Z\s&]+(?:Team|Technologies|Systems|Solutions|Ltd|Inc)?)')
+_RE_DESC = re.compile(r'description|תיאור|details', re.I)
+_RE_LISTING_DESC = re.compile(r'description|summary|תיאור', re.I)
+_RE_LOCATION = re.compile(r'location|area|city|מיקום', re.I)
+_RE_CITY = re.compile(r'(תל\s*אביב|ירושלים|חיפה|רעננה|הרצליה|לוד|נתניה)', re.I)
+_RE_HEB_DATE = re.compile(r'לפני|היום|שעות|דקות|ימים|שבועות', re.I)
+
+# Hebrew "posted N ago" expressions read by _parse_drushim_age, one named group per form
+# so a single scan finds all of them (the matching group is the match's lastgroup)
+_DATE_RE = re.compile(
+    r'לפני\s*(?:(?P<few_minutes>מספר\s*דקות?)|(?P<few_hours>מספר\s*שעות?)'
+    r'|(?P<minutes>\d+)\s*דקות?|(?P<hours>\d+)\s*שעות?|(?P<days>\d+)\s*ימים?|(?P<weeks>\d+)\s*שבועות?)'
+    r'|(?P<today>היום)',
+    re.IGNORECASE,
+)
+
+# Keyword variations -> canonical search term, checked in order (devsecops before devops)
+_KEYWORD_CANONICAL = {
+    'devsecops': 'devsecops',
+    'dev sec ops': 'devsecops',
+    'devops': 'devops',
+    'sre': 'sre',
+    'cloud': 'cloud'
+}
+
+# Map keywords to Drushim category IDs
+DRUSHIM_CATEGORY = {
+    'devops engineer': '491',
+    'devops': '491',
+    'devsecops': '491',  # DevSecOps is also in DevOps category
+    'sre': '491',  # SRE is also in DevOps category
+    'cloud engineer': '491',
+    'cloud': '491'
+}
+
+# Map keywords to proper Drushim search terms
+DRUSHIM_SEARCH_TERM = {
+    'devops engineer': 'DevOps',
+    'devops': 'DevOps',
+    'devsecops': 'DevSecOps',
+    'sre': 'SRE',
+    'cloud engineer': 'Cloud',
+    'cloud': 'Cloud'
+}
+
+# GotFriends uses category-based URLs
+GOTFRIENDS_DEFAULT_URL = 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/'
+GOTFRIENDS_URLS = {
+    'devops engineer': GOTFRIENDS_DEFAULT_URL,
+    'devops': GOTFRIENDS_DEFAULT_URL,
+    'devsecops': GOTFRIENDS_DEFAULT_URL,  # DevSecOps in DevOps category
+    'sre': 'https://www.gotfriends.co.il/jobslobby/system/sre/',
+    'cloud engineer': GOTFRIENDS_DEFAULT_URL,  # Cloud often in DevOps
+    'cloud': GOTFRIENDS_DEFAULT_URL
+}
+
+# Indeed search pages are only read for their job cards, so build just those subtrees
+_BEACON = SoupStrainer('div', class_='job_seen_beacon')
+
+# Indeed job card selectors, compiled once
+_INDEED_TITLE = soupsieve.compile('h2.jobTitle')
+_INDEED_COMPANY = soupsieve.compile('span.companyName')
+_INDEED_LOCATION = soupsieve.compile('div.companyLocation')
+_INDEED_SNIPPET = soupsieve.compile('div.job-snippet')
+
+# Indeed RSS endpoints, tried in order until one returns entries
+_INDEED_RSS_TMPL = (
+    'https://www.indeed.com/rss?q={q}&l={l}&sort=date',
+    'https://rss.indeed.com/rss?q={q}&l={l}&sort=date'
+)
+
+# Indeed web search URL; the keyword goes in with spaces turned into '+'
+_INDEED_SEARCH_TMPL = 'https://www.indeed.com/jobs?q={}&sort=date&fromage=1'
+_SPACE_TO_PLUS = str.maketrans(' ', '+')
+
+# SerpAPI Google Jobs endpoint and the query parameters shared by every call
+SERPAPI_URL = 'https://serpapi.com/search'
+_SERPAPI_BASE_PARAMS = {
+    'engine': 'google_jobs',
+    'num': 20  # Number of results
+}
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, like every other timestamp the bot stores"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _canonical_keyword(keyword: str) -> str:
+    """Normalize a search keyword to its canonical term (e.g. 'Senior DevOps Engineer' -> 'devops')"""
+    keyword_lower = keyword.lower().strip()
+    return next((canonical for variant, canonical in _KEYWORD_CANONICAL.items() if variant in keyword_lower), keyword_lower)
+
+
+def _collect_date_text(node, max_up: int = 2) -> str:
+    """Return the text of the closest ancestor (starting at node) that contains a Hebrew date indicator"""
+    current = node
+    for _ in range(max_up):
+        if current is None:
+            break
+        text = current.get_text(' ', strip=True)
+        if _RE_HEB_DATE.search(text):
+            return text
+        current = current.parent
+    return ''
+
+
+def _extract_title(element) -> str:
+    """Return the title text carried by a title candidate element"""
+    if element is None:
+        return ''
+    if element.name == 'meta':
+        return element.get('content', '').strip()
+    title = element.get_text(strip=True)
+    if element.name == 'title':
+        # Remove site name if present
+        title = title.split('|')[0].split('-')[0].strip()
+    return title
+
+
 class JobSearch:
-    def __init__(self, search_keywords: List[str], locations: List[str]):
+    def __init__(self, search_keywords: Sequence[str], locations: Sequence[str]):
         self.search_keywords = search_keywords
         self.locations = locations
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # One pooled session for all sources so repeated requests to the same host
+        # reuse the keep-alive connection instead of doing a new TCP+TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=64, max_retries=HTTP_RETRY)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Response bodies by (source, URL, params), each stored with its expiry time;
+        # kept across runs and bounded by RESPONSE_CACHE_TTL / RESPONSE_CACHE_SIZE
+        self._response_cache: Dict[Tuple, Tuple[float, bytes]] = {}
+        self._response_cache_lock = threading.Lock()
+        # Per-host semaphores bounding concurrent search calls in search_all_sources
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+    
+    def _cached_get(self, source: str, url: str, params: Optional[Dict] = None, timeout: int = 15,
+                    reader: Optional[Callable[[requests.Response], bytes]] = None) -> Tuple[int, bytes]:
+        """GET a URL through the response cache, returning (status code, body)"""
+        key = (source, url, tuple(sorted(params.items())) if params else ())
+        now = time.monotonic()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return 200, entry[1]
+        
+        # Always stream: the status is checked as soon as the headers arrive, and a failed
+        # response is closed without downloading its body (a reader may also stop early)
+        with self.session.get(url, params=params, timeout=timeout, stream=True) as response:
+            if response.status_code != 200:
+                return response.status_code, b''
+            body = reader(response) if reader else response.content
+        
+        # Only successful responses are cached, so failures are retried on the next call
+        with self._response_cache_lock:
+            cache = self._response_cache
+            cache.pop(key, None)
+            cache[key] = (now + RESPONSE_CACHE_TTL, body)
+            if len(cache) > RESPONSE_CACHE_SIZE:
+                for stale in [k for k, (expires, _) in cache.items() if expires <= now]:
+                    del cache[stale]
+                while len(cache) > RESPONSE_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+        return 200, body
     
     def search_drushim(self, keyword: str, location: str = "Israel") -> List[Dict]:
         """Search jobs on Drushim (Israeli job site)"""
+        return self.collect_drushim([keyword], location)
+    
+    def collect_drushim(self, keywords: Sequence[str], location: str = "Israel",
+                        seen_urls: Optional[Set[str]] = None) -> List[Dict]:
+        """Search Drushim for several keywords, fetching each listing and job page only once"""
+        # Job URLs already taken from a listing, shared by all keywords of the call (or the
+        # caller's run) so a job listed under several keywords is only parsed once
+        if seen_urls is None:
+            seen_urls = set()
         jobs = []
         try:
-            # Map keywords to Drushim category IDs
-            category_map = {
-                'devops engineer': '491',
-                'devops': '491',
-                'devsecops': '491',  # DevSecOps is also in DevOps category
-                'sre': '491',  # SRE is also in DevOps category
-                'cloud engineer': '491',
-                'cloud': '491'
-            }
-            
-            # Normalize keyword for category lookup
-            keyword_lower = keyword.lower().strip()
-            # Handle variations of keywords
-            if 'devsecops' in keyword_lower or 'dev sec ops' in keyword_lower:
-                keyword_lower = 'devsecops'
-            elif 'devops' in keyword_lower:
-                keyword_lower = 'devops'
-            elif 'sre' in keyword_lower:
-                keyword_lower = 'sre'
-            elif 'cloud' in keyword_lower:
-                keyword_lower = 'cloud'
-            
-            category_id = category_map.get(keyword_lower, '491')  # Default to DevOps category
+            # Keywords that resolve to the same listing URL only need one fetch
+            listing_urls = {}
+            for keyword in keywords:
+                listing_urls.setdefault(self._drushim_search_url(keyword), keyword)
             
-            # Map experience level to Drushim experience parameter
-            # Drushim experience parameters:
-            # 0 = לא נדרש ניסיון (no experience required)
-            # 1 = עד שנה (up to 1 year)
-            # 2 = 1-2 שנים (1-2 years)
-            # 3 = 3-5 שנים (3-5 years) - Too high for us
-            # We want 0-3 years, so we'll search for experience=1 (0-1 year) and experience=2 (1-2 years)
-            # This covers 0-3 years range better
-            
-            # Build Drushim URL using the exact format from the user's example
-            # URL: https://www.drushim.co.il/jobs/subcat/491/?experience=2&searchterm=DevOps&ssaen=3
-            # Map keywords to proper Drushim search terms
-            keyword_normalized = keyword.lower().strip()
-            search_term_map = {
-                'devops engineer': 'DevOps',
-                'devops': 'DevOps',
-                'devsecops': 'DevSecOps',
-                'sre': 'SRE',
-                'cloud engineer': 'Cloud',
-                'cloud': 'Cloud'
-            }
-            
-            # Get the search term, defaulting to capitalized keyword if not in map
-            search_term = search_term_map.get(keyword_normalized, keyword.replace(' ', '').capitalize())
-            
-            # Use experience=2 which filters for 1-2 years (closest to our 0-3 years requirement)
-            # We'll also filter by experience in the job_filter module
-            search_url = f"https://www.drushim.co.il/jobs/subcat/{category_id}/?experience=2&searchterm={search_term}&ssaen=3"
-            logger.info(f"Searching Drushim for '{keyword}' (search term: '{search_term}') using URL: {search_url}")
+            # Listings and job pages are independent network round-trips, so fetch them
+            # concurrently over the pooled session: all listings first, then the union of the
+            # job pages still needed (keywords share category 491, so pages overlap). Each
+            # worker parses what it fetched, so parsing overlaps the other workers' downloads.
+            # The requests themselves take a www.drushim.co.il host slot, so at most
+            # HOST_CONCURRENCY of them are in flight like for every other host.
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                # The listing can only be cut short after its first 20 links while none of them
+                # can have been taken already; with several listings the later ones skip the
+                # links of the earlier ones, so they are read in full to still yield 20 new jobs
+                read_head = len(listing_urls) == 1 and not seen_urls
+                listings = list(executor.map(lambda search_url: self._fetch_drushim_listing(search_url, read_head), listing_urls))
+                
+                targets_by_keyword = []
+                for (search_url, keyword), soup in zip(listing_urls.items(), listings):
+                    try:
+                        targets_by_keyword.append((keyword, self._drushim_job_targets(soup, search_url, keyword, seen_urls) if soup else []))
+                    except Exception as e:
+                        logger.error(f"Error fetching Drushim: {e}", exc_info=True)
+                
+                job_urls = list(dict.fromkeys(job_url for _, job_targets in targets_by_keyword for job_url, _, inline_title in job_targets if not inline_title))
+                job_soups = dict(zip(job_urls, executor.map(self._fetch_job_soup, job_urls)))
+            logger.info(f"Fetched {len(job_urls)} Drushim job pages")
             
-            try:
-                response = requests.get(search_url, headers=self.headers, timeout=15)
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.content, 'html.parser')
-                    
-                    # Parse jobs from the list page
-                    # Drushim uses /job/{job_id}/{hash}/ format (singular "job", not "jobs")
-                    # Examples: /job/35010030/7fce2efe/, /job/35164538/59724395/
-                    job_links = soup.find_all('a', href=re.compile(r'/job/\d+/\w+/'))
-                    logger.info(f"Found {len(job_links)} job links on Drushim page using /job/ pattern")
-                    
-                    if len(job_links) == 0:
-                        # Fallback: try without the hash part
-                        job_links = soup.find_all('a', href=re.compile(r'/job/\d+'))
-                        logger.info(f"Found {len(job_links)} job links with fallback pattern")
-                        
-                        if len(job_links) == 0:
-                            logger.warning(f"WARNING: No job links found on Drushim page. URL: {search_url}")
-                            # Check if page has job content
-                            page_text = soup.get_text()
-                            if 'דרושים' in page_text or 'משרות' in page_text or 'לפני' in page_text:
-                                logger.warning("Page contains job-related content, but job links not found")
-                    
-                    # Process each job link
-                    # Note: We'll fetch each job page to get details (slower but more reliable)
-                    seen_urls = set()
-                    processed_count = 0
-                    max_jobs = 20  # Increased limit for better coverage
-                    logger.info(f"Processing up to {max_jobs} jobs from {len(job_links)} links found")
-                    for link in job_links:
-                        if processed_count >= max_jobs:
-                            logger.info(f"Reached max_jobs limit ({max_jobs}), stopping processing")
-                            break
-                        try:
-                            # Get job URL
-                            href = link.get('href', '')
-                            if not href:
-                                continue
-                            
-                            # Drushim job URLs are in format /job/{id}/{hash}/
-                            # Make sure it's a valid job URL (not a category or search page)
-                            if not re.search(r'/job/\d+', href):
-                                continue
-                            
-                            if not href.startswith('http'):
-                                job_url = f"https://www.drushim.co.il{href}"
-                            else:
-                                job_url = href
-                            
-                            # Skip duplicates
-                            if job_url in seen_urls:
-                                continue
-                            seen_urls.add(job_url)
-                            processed_count += 1
-                            logger.debug(f"Processing job {processed_count}/{max_jobs}: {job_url}")
-                            
-                            # Get the parent container to extract job details
-                            parent = link.find_parent(['article', 'div', 'li', 'tr', 'td'])
-                            if not parent:
-                                parent = link.find_parent()
-                            
-                            # Extract job title
-                            # The link we found is just an "open in new window" icon
-                            # We need to fetch the actual job page to get the title
-                            title = ''
-                            job_page_response = None
-                            job_soup = None
-                            
-                            try:
-                                # Fetch the job page to get the title
-                                job_page_response = requests.get(job_url, headers=self.headers, timeout=10)
-                                if job_page_response.status_code == 200:
-                                    job_soup = BeautifulSoup(job_page_response.content, 'html.parser')
-                                    
-                                    # Look for title in various places on the job page
-                                    # Method 1: Look for h1 or h2 with title/job classes
-                                    title_elem = job_soup.find(['h1', 'h2'], class_=re.compile(r'title|job|position|name', re.I))
-                                    if title_elem:
-                                        title = title_elem.get_text(strip=True)
-                                    
-                                    # Method 2: Look for any h1 (usually the job title)
-                                    if not title or len(title) < 3:
-                                        h1 = job_soup.find('h1')
-                                        if h1:
-                                            title = h1.get_text(strip=True)
-                                    
-                                    # Method 3: Look for page title tag
-                                    if not title or len(title) < 3:
-                                        if job_soup.title:
-                                            title_text = job_soup.title.get_text(strip=True)
-                                            # Remove site name if present
-                                            title = title_text.split('|')[0].split('-')[0].strip()
-                                    
-                                    # Method 4: Look for meta title
-                                    if not title or len(title) < 3:
-                                        meta_title = job_soup.find('meta', property='og:title')
-                                        if meta_title:
-                                            title = meta_title.get('content', '').strip()
-                                
-                                if not title or len(title) < 3:
-                                    logger.warning(f"Could not extract title from job page {job_url[:80]}")
-                                    continue
-                                    
-                            except Exception as e:
-                                logger.error(f"Error fetching job page {job_url[:80]}: {e}", exc_info=True)
+            # Extract the results here in listing order
+            for keyword, job_targets in targets_by_keyword:
+                keyword_jobs = []
+                for job_url, parent, inline_title in job_targets:
+                    try:
+                        if inline_title:
+                            job = self._extract_drushim_listing_job(inline_title, job_url, parent, location)
+                        else:
+                            job_soup = job_soups.get(job_url)
+                            if job_soup is None:
                                 continue
-                            
-                            # Extract company name and description from job page
-                            company = ''
-                            description = ''
-                            
-                            # Use the job page soup we already fetched
-                            if job_page_response and job_page_response.status_code == 200 and job_soup:
-                                # Extract company from job page
-                                company_elem = job_soup.find(['span', 'div', 'a'], class_=re.compile(r'company|employer|חברה', re.I))
-                                if company_elem:
-                                    company = company_elem.get_text(strip=True)
-                                
-                                # Extract description from job page
-                                desc_elem = job_soup.find(['div', 'section'], class_=re.compile(r'description|תיאור|details', re.I))
-                                if desc_elem:
-                                    description = desc_elem.get_text(strip=True)[:500]
-                                else:
-                                    # Get all paragraphs
-                                    paragraphs = job_soup.find_all('p')
-                                    if paragraphs:
-                                        description = ' '.join([p.get_text(strip=True) for p in paragraphs[:3]])[:500]
-                            
-                            # Fallback to parent if job page didn't have info
-                            if not company and parent:
-                                # Try multiple ways to find company
-                                company_text = parent.get_text()
-                                # Look for company name patterns
-                                company_match = re.search(r'([A-Z][a-zA-Z\s&]+(?:Team|Technologies|Systems|Solutions|Ltd|Inc)?)', company_text)
-                                if company_match:
-                                    company = company_match.group(1).strip()
-                                
-                                # Also try to find in structured elements
-                                if not company:
-                                    company_elem = parent.find(['span', 'div', 'a'], class_=re.compile(r'company|employer', re.I))
-                                    if company_elem:
-                                        company = company_elem.get_text(strip=True)
-                            
-                            # Extract location from job page
-                            location_text = location
-                            if job_page_response and job_page_response.status_code == 200 and job_soup:
-                                location_elem = job_soup.find(['span', 'div'], class_=re.compile(r'location|area|city|מיקום', re.I))
-                                if location_elem:
-                                    location_text = location_elem.get_text(strip=True)
-                            
-                            # Extract posted date from job page
-                            parent_text = ''
-                            if job_page_response and job_page_response.status_code == 200 and job_soup:
-                                # Get all text from job page
-                                parent_text = job_soup.get_text()
-                            
-                            # Also check sibling elements for date info
-                            if parent:
-                                # Look for time/date elements in the parent and its siblings
-                                time_elems = parent.find_all(['time', 'span', 'div', 'p'], class_=re.compile(r'time|date|posted|לפני|שעות|דקות', re.I))
-                                for time_elem in time_elems:
-                                    time_text = time_elem.get_text()
-                                    if re.search(r'לפני|היום|שעות|דקות|ימים', time_text, re.I):
-                                        parent_text += ' ' + time_text
-                                
-                                # Also check parent's siblings for date info
-                                if parent.parent:
-                                    siblings = parent.parent.find_all(['span', 'div', 'time'], class_=re.compile(r'time|date|posted', re.I))
-                                    for sibling in siblings:
-                                        sibling_text = sibling.get_text()
-                                        if re.search(r'לפני|היום|שעות|דקות|ימים', sibling_text, re.I):
-                                            parent_text += ' ' + sibling_text
-                                
-                                # Check parent's parent for date info
-                                grandparent = parent.find_parent()
-                                if grandparent:
-                                    grandparent_text = grandparent.get_text()
-                                    # Check if grandparent has date info
-                                    if re.search(r'לפני|היום|שעות|דקות|ימים|שבועות', grandparent_text, re.I):
-                                        parent_text += ' ' + grandparent_text
-                            
-                            # Parse the date from the collected text
-                            posted_date = self._parse_drushim_date(parent_text)
-                            
-                            # Debug: Log if we found date info
-                            if posted_date:
-                                hours_ago = (datetime.utcnow() - posted_date).total_seconds() / 3600
-                                logger.info(f"Added job: {title[:50]} - Posted {hours_ago:.1f} hours ago (Date: {posted_date})")
-                            else:
-                                # Try to find date info in the full page text if not found in parent
-                                if 'לפני' in parent_text or 'היום' in parent_text:
-                                    logger.warning(f"Warning: Could not parse date for '{title[:50]}' but found date indicators in text")
-                                else:
-                                    logger.info(f"Added job: {title[:50]} - No date found in text (will be included if from today)")
-                            
-                            job = {
-                                'title': title,
-                                'company': company or 'Unknown',
-                                'location': location_text,
-                                'url': job_url,
-                                'description': description or '',
-                                'source': 'drushim',
-                                'posted_date': posted_date
-                            }
-                            jobs.append(job)
-                            logger.info(f"Successfully added job: '{title[:60]}' from {company or 'Unknown'}")
-                        except Exception as e:
-                            logger.error(f"Error parsing Drushim job: {e}", exc_info=True)
-                            continue
-                else:
-                    logger.error(f"Failed to fetch Drushim page: {response.status_code}")
-            except Exception as e:
-                logger.error(f"Error fetching Drushim: {e}", exc_info=True)
+                            job = self._extract_drushim_job(job_soup, job_url, parent, location)
+                        if job:
+                            keyword_jobs.append(job)
+                    except (AttributeError, TypeError, ValueError) as e:
+                        logger.warning(f"Error parsing Drushim job {job_url[:80]}: {e}")
+                        continue
+                logger.info(f"Returning {len(keyword_jobs)} jobs from Drushim for keyword '{keyword}'")
+                jobs.extend(keyword_jobs)
                             
         except Exception as e:
             logger.error(f"Error in search_drushim: {e}", exc_info=True)
         
-        logger.info(f"Returning {len(jobs)} jobs from Drushim for keyword '{keyword}'")
         return jobs
     
-    def search_gotfriends(self, keyword: str, location: str = "Israel") -> List[Dict]:
-        """Search jobs on GotFriends (Israeli job site)"""
-        jobs = []
+    def _drushim_search_url(self, keyword: str) -> str:
+        """Build the Drushim listing URL for a keyword"""
+        category_id = DRUSHIM_CATEGORY.get(_canonical_keyword(keyword), '491')  # Default to DevOps category
+        
+        # Map experience level to Drushim experience parameter
+        # Drushim experience parameters:
+        # 0 = לא נדרש ניסיון (no experience required)
+        # 1 = עד שנה (up to 1 year)
+        # 2 = 1-2 שנים (1-2 years)
+        # 3 = 3-5 שנים (3-5 years) - Too high for us
+        # We want 0-3 years, so we'll search for experience=1 (0-1 year) and experience=2 (1-2 years)
+        # This covers 0-3 years range better
+        
+        # Build Drushim URL using the exact format from the user's example
+        # URL: https://www.drushim.co.il/jobs/subcat/491/?experience=2&searchterm=DevOps&ssaen=3
+        keyword_normalized = keyword.lower().strip()
+        
+        # Get the search term, defaulting to capitalized keyword if not in map
+        search_term = DRUSHIM_SEARCH_TERM.get(keyword_normalized, keyword.replace(' ', '').capitalize())
+        
+        # Use experience=2 which filters for 1-2 years (closest to our 0-3 years requirement)
+        # We'll also filter by experience in the job_filter module
+        search_url = f"https://www.drushim.co.il/jobs/subcat/{category_id}/?experience=2&searchterm={search_term}&ssaen=3"
+        logger.info(f"Searching Drushim for '{keyword}' (search term: '{search_term}') using URL: {search_url}")
+        return search_url
+    
+    def _fetch_drushim_listing(self, search_url: str, read_head: bool = False) -> Optional[BeautifulSoup]:
+        """Fetch and parse a Drushim listing page, returning None if the request failed"""
         try:
-            # GotFriends uses category-based URLs
-            category_urls = {
-                'devops engineer': 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/',
-                'devops': 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/',
-                'devsecops': 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/',  # DevSecOps in DevOps category
-                'sre': 'https://www.gotfriends.co.il/jobslobby/system/sre/',
-                'cloud engineer': 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/',  # Cloud often in DevOps
-                'cloud': 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/'
-            }
+            # A truncated listing is cached apart from the full one, so a later full read
+            # never gets served the first 20 links only
+            with self._host_slot('www.drushim.co.il'):
+                if read_head:
+                    status, listing = self._cached_get('drushim-head', search_url, reader=self._read_drushim_listing)
+                else:
+                    status, listing = self._cached_get('drushim', search_url)
+            if status != 200:
+                logger.error(f"Failed to fetch Drushim page: {status}")
+                return None
+            return _SOUP(listing)
+        except requests.RequestException as e:
+            logger.error(f"Error fetching Drushim: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching Drushim: {e}", exc_info=True)
+            return None
+    
+    def _read_drushim_listing(self, response: requests.Response, max_links: int = 20) -> bytes:
+        """Read a streamed Drushim listing until enough job links have been seen"""
+        # Only the first max_links job links are processed, so stop downloading once
+        # they have all arrived (plus one more chunk so the last listing row is complete)
+        parser = etree.HTMLPullParser(events=('start',), tag='a')
+        chunks = []
+        job_urls = set()
+        for chunk in response.iter_content(8192):
+            chunks.append(chunk)
+            if len(job_urls) >= max_links:
+                break
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                href = element.get('href', '')
+                if _RE_JOB_HREF_WITH_HASH.search(href):
+                    job_urls.add(href if href.startswith('http') else f"https://www.drushim.co.il{href}")
+        return b''.join(chunks)
+    
+    def _drushim_job_targets(self, soup: BeautifulSoup, search_url: str, keyword: str,
+                             seen_urls: Set[str]) -> List[Tuple[str, Optional[Tag], str]]:
+        """Collect up to max_jobs unique (job URL, listing container, inline title) entries from a Drushim listing"""
+        # Parse jobs from the list page
+        # Drushim uses /job/{job_id}/{hash}/ format (singular "job", not "jobs")
+        # Examples: /job/35010030/7fce2efe/, /job/35164538/59724395/
+        # Collect the candidate anchors with one CSS pass and filter both patterns from that list
+        candidate_links = soup.select("a[href*='/job/']")
+        job_links = [link for link in candidate_links if _RE_JOB_HREF_WITH_HASH.search(link['href'])]
+        logger.info(f"Found {len(job_links)} job links on Drushim page using /job/ pattern")
+        
+        if len(job_links) == 0:
+            # Fallback: try without the hash part
+            job_links = [link for link in candidate_links if _RE_JOB_HREF.search(link['href'])]
+            logger.info(f"Found {len(job_links)} job links with fallback pattern")
             
-            # Normalize keyword for category lookup
-            keyword_lower = keyword.lower().strip()
-            # Handle variations
-            if 'devsecops' in keyword_lower or 'dev sec ops' in keyword_lower:
-                keyword_lower = 'devsecops'
-            elif 'devops' in keyword_lower:
-                keyword_lower = 'devops'
-            elif 'sre' in keyword_lower:
-                keyword_lower = 'sre'
-            elif 'cloud' in keyword_lower:
-                keyword_lower = 'cloud'
+            if len(job_links) == 0:
+                logger.warning(f"WARNING: No job links found on Drushim page. URL: {search_url}")
+                # Check if page has job content
+                page_text = soup.get_text()
+                if 'דרושים' in page_text or 'משרות' in page_text or 'לפני' in page_text:
+                    logger.warning("Page contains job-related content, but job links not found")
+        
+        # Process each job link
+        canonical = _canonical_keyword(keyword)
+        job_targets = []
+        max_jobs = 20  # Increased limit for better coverage
+        logger.info(f"Processing up to {max_jobs} jobs from {len(job_links)} links found")
+        for link in job_links:
+            if len(job_targets) >= max_jobs:
+                logger.info(f"Reached max_jobs limit ({max_jobs}), stopping processing")
+                break
+            # Get job URL
+            href = link.get('href', '')
+            if not href:
+                continue
+            
+            # Drushim job URLs are in format /job/{id}/{hash}/
+            # Make sure it's a valid job URL (not a category or search page)
+            if not _RE_JOB_HREF.search(href):
+                continue
+            
+            if not href.startswith('http'):
+                job_url = f"https://www.drushim.co.il{href}"
+            else:
+                job_url = href
+            
+            # Skip duplicates, including jobs already taken from another keyword's listing
+            if job_url in seen_urls:
+                continue
+            seen_urls.add(job_url)
             
+            # Get the parent container to extract job details
+            parent = link.find_parent(['article', 'div', 'li', 'tr', 'td'])
+            if not parent:
+                parent = link.find_parent()
+            
+            # Most links are just "open in new window" icons, but when the anchor itself
+            # carries the job title (it mentions the search term) keep it, so the job can
+            # be built from the listing row without fetching its page
+            inline_title = link.get_text(strip=True)
+            if len(inline_title) < 3 or canonical not in inline_title.lower():
+                inline_title = ''
+            job_targets.append((job_url, parent, inline_title))
+            logger.debug(f"Processing job {len(job_targets)}/{max_jobs}: {job_url}")
+        return job_targets
+    
+    def _fetch_job_page(self, job_url: str) -> Optional[bytes]:
+        """Fetch a job page body through the response cache"""
+        # The Drushim search terms all map to the same category, so the same job pages
+        # show up under several keywords and on consecutive runs
+        try:
+            with self._host_slot('www.drushim.co.il'):
+                status, page = self._cached_get('drushim', job_url, timeout=10)
+        except requests.Timeout:
+            logger.warning(f"Timed out fetching job page {job_url[:80]}")
+            return None
+        except requests.RequestException as e:
+            logger.warning(f"Error fetching job page {job_url[:80]}: {e}")
+            return None
+        if status != 200:
+            logger.warning(f"Failed to fetch job page {job_url[:80]}: {status}")
+            return None
+        return page
+    
+    def _fetch_job_soup(self, job_url: str) -> Optional[BeautifulSoup]:
+        """Fetch a job page and parse it in the calling worker thread"""
+        job_page = self._fetch_job_page(job_url)
+        if job_page is None:
+            return None
+        try:
+            return _SOUP(job_page, parse_only=DETAIL_PAGE_STRAINER)
+        except ParserRejectedMarkup as e:
+            logger.warning(f"Error parsing Drushim job {job_url[:80]}: {e}")
+            return None
+    
+    def _extract_drushim_job(self, job_soup: BeautifulSoup, job_url: str, parent, location: str) -> Optional[Dict]:
+        """Build a job dict from a parsed Drushim job page and its listing container"""
+        # Collect everything the extraction needs in a single walk over the page instead of
+        # separate find()/find_all() passes; each slot keeps its first match in document order
+        title_elem = h1 = title_tag = meta_title = company_elem = desc_elem = location_elem = None
+        paragraphs = []
+        date_strings = []
+        for element in job_soup.descendants:
+            if isinstance(element, NavigableString):
+                # Only the text nodes carrying a Hebrew time indicator matter for the date
+                if _RE_HEB_DATE.search(element):
+                    date_strings.append(element)
+                continue
+            tag = element.name
+            if tag == 'p':
+                if len(paragraphs) < 3:
+                    paragraphs.append(element)
+            elif tag == 'h1':
+                if h1 is None:
+                    h1 = element
+            elif tag == 'title':
+                if title_tag is None:
+                    title_tag = element
+            elif tag == 'meta':
+                if meta_title is None and element.get('property') == 'og:title':
+                    meta_title = element
+            classes = element.get('class')
+            if not classes:
+                continue
+            class_text = ' '.join(classes)
+            if title_elem is None and tag in ('h1', 'h2') and _RE_TITLE.search(class_text):
+                title_elem = element
+            if company_elem is None and tag in ('span', 'div', 'a') and _RE_COMPANY.search(class_text):
+                company_elem = element
+            if desc_elem is None and tag in ('div', 'section') and _RE_DESC.search(class_text):
+                desc_elem = element
+            if location_elem is None and tag in ('span', 'div') and _RE_LOCATION.search(class_text):
+                location_elem = element
+        
+        # Extract job title
+        # The link we found is just an "open in new window" icon
+        # We need the actual job page to get the title
+        # Look for title in various places on the job page, in order of preference:
+        # h1/h2 with title/job classes, any h1, the page title tag, the meta title
+        title = ''
+        for candidate in (title_elem, h1, title_tag, meta_title):
+            title = _extract_title(candidate)
+            if len(title) >= 3:
+                break
+        
+        if not title or len(title) < 3:
+            logger.warning(f"Could not extract title from job page {job_url[:80]}")
+            return None
+        
+        # Extract company name and description from job page
+        company = ''
+        description = ''
+        if company_elem:
+            company = company_elem.get_text(strip=True)
+        
+        # Extract description from job page
+        if desc_elem:
+            description = desc_elem.get_text(strip=True)[:500]
+        elif paragraphs:
+            # Use the first paragraphs
+            description = ' '.join([p.get_text(strip=True) for p in paragraphs])[:500]
+        
+        # Fallback to parent if job page didn't have info
+        if not company and parent:
+            # Try multiple ways to find company
+            company_text = parent.get_text()
+            # Look for company name patterns
+            company_match = _RE_COMPANY_NAME.search(company_text)
+            if company_match:
+                company = company_match.group(1).strip()
+            
+            # Also try to find in structured elements
+            if not company:
+                company_elem = parent.find(['span', 'div', 'a'], class_=_RE_LISTING_COMPANY)
+                if company_elem:
+                    company = company_elem.get_text(strip=True)
+        
+        # Extract location from job page
+        location_text = location
+        if location_elem:
+            location_text = location_elem.get_text(strip=True)
+        
+        # Extract posted date from job page
+        parent_text = ' '.join(date_strings)
+        posted_date = self._parse_drushim_date(parent_text)
+        
+        # Fall back to the listing container when the job page had no date
+        if not posted_date and parent:
+            parent_text = _collect_date_text(parent)
+            posted_date = self._parse_drushim_date(parent_text)
+        
+        # Debug: Log if we found date info
+        if posted_date:
+            if logger.isEnabledFor(logging.INFO):
+                hours_ago = (_utcnow() - posted_date).total_seconds() / 3600
+                logger.info(f"Added job: {title[:50]} - Posted {hours_ago:.1f} hours ago (Date: {posted_date})")
+        else:
+            # Try to find date info in the full page text if not found in parent
+            if 'לפני' in parent_text or 'היום' in parent_text:
+                logger.warning(f"Warning: Could not parse date for '{title[:50]}' but found date indicators in text")
+            else:
+                logger.info(f"Added job: {title[:50]} - No date found in text (will be included if from today)")
+        
+        job = {
+            'title': title,
+            'company': company or 'Unknown',
+            'location': location_text,
+            'url': job_url,
+            'description': description or '',
+            'source': 'drushim',
+            'posted_date': posted_date
+        }
+        logger.info(f"Successfully added job: '{title[:60]}' from {company or 'Unknown'}")
+        return job
+    
+    def _extract_drushim_listing_job(self, title: str, job_url: str, parent, location: str) -> Dict:
+        """Build a job dict from a Drushim listing row whose link already carries the title"""
+        company, location_text, description = self._extract_listing_details(parent, location, title)
+        posted_date = self._parse_drushim_date(_collect_date_text(parent) if parent else '')
+        logger.info(f"Added job from listing: '{title[:60]}' from {company or 'Unknown'}")
+        return {
+            'title': title,
+            'company': company or 'Unknown',
+            'location': location_text,
+            'url': job_url,
+            'description': description,
+            'source': 'drushim',
+            'posted_date': posted_date
+        }
+    
+    def search_gotfriends(self, keyword: str, location: str = "Israel",
+                          seen_urls: Optional[Set[str]] = None) -> List[Dict]:
+        """Search jobs on GotFriends (Israeli job site)"""
+        # Job URLs already taken, shared across keywords when the caller passes its run's set
+        if seen_urls is None:
+            seen_urls = set()
+        jobs = []
+        try:
             # Get the appropriate URL for the keyword
-            search_url = category_urls.get(keyword_lower, 'https://www.gotfriends.co.il/jobslobby/system/devops-positions/')
+            search_url = GOTFRIENDS_URLS.get(_canonical_keyword(keyword), GOTFRIENDS_DEFAULT_URL)
             logger.info(f"Searching GotFriends for '{keyword}' using URL: {search_url}")
             
             # Note: GotFriends may filter by experience on the page itself
             # We'll filter by experience in the job_filter after fetching
             
-            response = requests.get(search_url, headers=self.headers, timeout=15)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
+            status, page = self._cached_get('gotfriends', search_url)
+            if status == 200:
+                soup = _SOUP(page)
                 
                 # Parse GotFriends job listings
                 # Look for job links on the page
-                job_links = soup.find_all('a', href=re.compile(r'/job/|/position/|/jobs/'))
+                job_links = soup.find_all('a', href=_RE_GOTFRIENDS_HREF)
                 logger.info(f"Found {len(job_links)} GotFriends job links")
                 if len(job_links) == 0:
                     logger.warning(f"WARNING: No job links found on GotFriends page. URL: {search_url}")
                 
-                seen_urls = set()
                 for link in job_links[:30]:  # Limit to 30 jobs
                     try:
                         # Get job URL
@@ -353,7 +636,7 @@ class JobSearch:
                         else:
                             job_url = href
                         
-                        # Skip duplicates
+                        # Skip duplicates, including jobs already found for another keyword
                         if job_url in seen_urls:
                             continue
                         seen_urls.add(job_url)
@@ -373,66 +656,18 @@ class JobSearch:
                         if not title or len(title) < 3:
                             continue
                         
-                        # Extract company
-                        company = ''
-                        if parent:
-                            company_text = parent.get_text()
-                            company_match = re.search(r'([A-Z][a-zA-Z\s&]+(?:Team|Technologies|Systems|Solutions|Ltd|Inc)?)', company_text)
-                            if company_match:
-                                company = company_match.group(1).strip()
-                            
-                            if not company:
-                                company_elem = parent.find(['span', 'div', 'a'], class_=re.compile(r'company|employer', re.I))
-                                if company_elem:
-                                    company = company_elem.get_text(strip=True)
-                        
-                        # Extract location
-                        location_text = location
-                        if parent:
-                            location_elem = parent.find(['span', 'div'], class_=re.compile(r'location|area|city|מיקום', re.I))
-                            if location_elem:
-                                location_text = location_elem.get_text(strip=True)
-                            else:
-                                location_match = re.search(r'(תל\s*אביב|ירושלים|חיפה|רעננה|הרצליה|לוד|נתניה)', parent.get_text(), re.I)
-                                if location_match:
-                                    location_text = location_match.group(1)
-                        
-                        # Extract description
-                        description = ''
-                        if parent:
-                            desc_elem = parent.find(['p', 'div'], class_=re.compile(r'description|summary|תיאור', re.I))
-                            if desc_elem:
-                                description = desc_elem.get_text(strip=True)[:300]
-                            else:
-                                para = parent.find('p')
-                                if para:
-                                    description = para.get_text(strip=True)[:300]
+                        company, location_text, description = self._extract_listing_details(parent, location)
                         
                         # Extract posted date from GotFriends (similar pattern to Drushim)
-                        parent_text = parent.get_text() if parent else ''
-                        
-                        # Check for date elements similar to Drushim
-                        if parent:
-                            # Look for time/date elements
-                            time_elems = parent.find_all(['time', 'span', 'div', 'p'], class_=re.compile(r'time|date|posted|לפני|שעות|דקות', re.I))
-                            for time_elem in time_elems:
-                                time_text = time_elem.get_text()
-                                if re.search(r'לפני|היום|שעות|דקות|ימים', time_text, re.I):
-                                    parent_text += ' ' + time_text
-                            
-                            # Check parent's parent for date info
-                            grandparent = parent.find_parent()
-                            if grandparent:
-                                grandparent_text = grandparent.get_text()
-                                if re.search(r'לפני|היום|שעות|דקות|ימים|שבועות', grandparent_text, re.I):
-                                    parent_text += ' ' + grandparent_text
+                        parent_text = _collect_date_text(parent) if parent else ''
                         
                         posted_date = self._parse_drushim_date(parent_text)
                         
                         # Debug: Log date info
                         if posted_date:
-                            hours_ago = (datetime.utcnow() - posted_date).total_seconds() / 3600
-                            logger.info(f"Added GotFriends job: {title[:50]} - Posted {hours_ago:.1f} hours ago")
+                            if logger.isEnabledFor(logging.INFO):
+                                hours_ago = (_utcnow() - posted_date).total_seconds() / 3600
+                                logger.info(f"Added GotFriends job: {title[:50]} - Posted {hours_ago:.1f} hours ago")
                         else:
                             logger.info(f"Added GotFriends job: {title[:50]} - No date found")
                         
@@ -446,11 +681,11 @@ class JobSearch:
                             'posted_date': posted_date
                         }
                         jobs.append(job)
-                    except Exception as e:
-                        logger.error(f"Error parsing GotFriends job: {e}")
+                    except (AttributeError, TypeError, ValueError) as e:
+                        logger.warning(f"Error parsing GotFriends job: {e}")
                         continue
             else:
-                logger.error(f"Failed to fetch GotFriends page: {response.status_code}")
+                logger.error(f"Failed to fetch GotFriends page: {status}")
                             
         except Exception as e:
             logger.error(f"Error in search_gotfriends: {e}", exc_info=True)
@@ -458,23 +693,63 @@ class JobSearch:
         logger.info(f"Returning {len(jobs)} jobs from GotFriends for keyword '{keyword}'")
         return jobs
     
+    def _extract_listing_details(self, parent, location: str, title: str = '') -> Tuple[str, str, str]:
+        """Extract (company, location, description) from a job's listing container"""
+        # Extract company
+        company = ''
+        if parent:
+            company_text = parent.get_text()
+            if title:
+                # Keep the capitalized-name pattern from matching the job title itself
+                company_text = company_text.replace(title, ' ', 1)
+            company_match = _RE_COMPANY_NAME.search(company_text)
+            if company_match:
+                company = company_match.group(1).strip()
+            
+            if not company:
+                company_elem = parent.find(['span', 'div', 'a'], class_=_RE_LISTING_COMPANY)
+                if company_elem:
+                    company = company_elem.get_text(strip=True)
+        
+        # Extract location
+        location_text = location
+        if parent:
+            location_elem = parent.find(['span', 'div'], class_=_RE_LOCATION)
+            if location_elem:
+                location_text = location_elem.get_text(strip=True)
+            else:
+                location_match = _RE_CITY.search(parent.get_text())
+                if location_match:
+                    location_text = location_match.group(1)
+        
+        # Extract description
+        description = ''
+        if parent:
+            desc_elem = parent.find(['p', 'div'], class_=_RE_LISTING_DESC)
+            if desc_elem:
+                description = desc_elem.get_text(strip=True)[:300]
+            else:
+                para = parent.find('p')
+                if para:
+                    description = para.get_text(strip=True)[:300]
+        
+        return company, location_text, description
+    
     def search_indeed_rss(self, keyword: str, location: str = "Israel") -> List[Dict]:
         """Search jobs using Indeed RSS feeds"""
         jobs = []
         try:
             # Indeed RSS feed format
-            keyword_encoded = keyword.replace(' ', '+')
-            location_encoded = location.replace(' ', '+').replace(',', '%2C')
+            keyword_encoded = quote_plus(keyword)
+            location_encoded = quote_plus(location)
             
             # Try different RSS URLs
-            rss_urls = [
-                f"https://www.indeed.com/rss?q={keyword_encoded}&l={location_encoded}&sort=date",
-                f"https://rss.indeed.com/rss?q={keyword_encoded}&l={location_encoded}&sort=date"
-            ]
-            
-            for rss_url in rss_urls:
+            for rss_url_template in _INDEED_RSS_TMPL:
+                rss_url = rss_url_template.format(q=keyword_encoded, l=location_encoded)
                 try:
-                    feed = feedparser.parse(rss_url)
+                    # Fetch through the shared session; feedparser would open its own connection
+                    _, body = self._cached_get('indeed', rss_url)
+                    feed = feedparser.parse(body)
                     if feed.entries:
                         for entry in feed.entries:
                             job = {
@@ -506,21 +781,20 @@ class JobSearch:
         jobs = []
         try:
             logger.info(f"Searching SerpAPI (Google Jobs) for '{keyword}' in '{location}'")
-            params = {
-                'engine': 'google_jobs',
-                'q': keyword,
-                'location': location,
-                'api_key': api_key,
-                'num': 20  # Number of results
-            }
+            params = _SERPAPI_BASE_PARAMS | {'q': keyword, 'location': location, 'api_key': api_key}
             
-            response = requests.get('https://serpapi.com/search', params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+            # Pooled session keeps the serpapi.com connection warm across keyword×location calls,
+            # and a query already answered within RESPONSE_CACHE_TTL costs no API credit
+            status, body = self._cached_get('serpapi', SERPAPI_URL, params=params)
+            if status != 200:
+                raise requests.HTTPError(f"SerpAPI returned {status}")
+            # Decode straight from the cached bytes; orjson skips the bytes -> str -> json round trip
+            data = orjson.loads(body)
             
             if 'jobs_results' in data:
                 logger.info(f"Found {len(data['jobs_results'])} jobs from SerpAPI for '{keyword}' in '{location}'")
                 for job_result in data['jobs_results']:
+                    ext = job_result.get('detected_extensions') or {}
                     job = {
                         'title': job_result.get('title', ''),
                         'company': job_result.get('company_name', ''),
@@ -528,7 +802,7 @@ class JobSearch:
                         'url': job_result.get('apply_options', [{}])[0].get('link', job_result.get('google_jobs_link', '')),
                         'description': job_result.get('description', ''),
                         'source': 'google_jobs',
-                        'posted_date': self._parse_serpapi_date(job_result.get('detected_extensions', {}).get('posted_at'))
+                        'posted_date': self._parse_serpapi_date(ext.get('posted_at'))
                     }
                     jobs.append(job)
             else:
@@ -551,28 +825,34 @@ class JobSearch:
         
         # Indeed web scraping (fallback if RSS doesn't work)
         try:
-            keyword_encoded = keyword.replace(' ', '+')
-            url = f"https://www.indeed.com/jobs?q={keyword_encoded}&sort=date&fromage=1"
+            url = _INDEED_SEARCH_TMPL.format(keyword.translate(_SPACE_TO_PLUS))
             
-            response = requests.get(url, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('div', class_='job_seen_beacon')
+            status, page = self._cached_get('indeed', url, timeout=10)
+            if status == 200:
+                # Only the job card subtrees are built, so the cards are the top-level elements
+                soup = _SOUP(page, parse_only=_BEACON)
+                job_cards = soup.find_all('div', recursive=False, limit=10)  # Limit to 10 results
                 
-                for card in job_cards[:10]:  # Limit to 10 results
+                # Bind the compiled selectors to locals for the card loop
+                select_title = _INDEED_TITLE.select_one
+                select_company = _INDEED_COMPANY.select_one
+                select_location = _INDEED_LOCATION.select_one
+                select_snippet = _INDEED_SNIPPET.select_one
+                now = _utcnow()
+                for card in job_cards:
                     try:
-                        title_elem = card.find('h2', class_='jobTitle')
+                        title_elem = select_title(card)
                         title = title_elem.get_text(strip=True) if title_elem else ''
                         job_link = title_elem.find('a') if title_elem else None
                         url_suffix = job_link.get('href', '') if job_link else ''
                         
-                        company_elem = card.find('span', class_='companyName')
+                        company_elem = select_company(card)
                         company = company_elem.get_text(strip=True) if company_elem else ''
                         
-                        location_elem = card.find('div', class_='companyLocation')
+                        location_elem = select_location(card)
                         location = location_elem.get_text(strip=True) if location_elem else ''
                         
-                        snippet_elem = card.find('div', class_='job-snippet')
+                        snippet_elem = select_snippet(card)
                         description = snippet_elem.get_text(strip=True) if snippet_elem else ''
                         
                         if title and url_suffix:
@@ -585,7 +865,7 @@ class JobSearch:
                                 'url': full_url,
                                 'description': description,
                                 'source': 'indeed_web',
-                                'posted_date': datetime.utcnow()
+                                'posted_date': now
                             }
                             jobs.append(job)
                     except Exception as e:
@@ -597,67 +877,72 @@ class JobSearch:
         
         return jobs
     
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        """Return the semaphore bounding concurrent search calls to a host"""
+        with self._host_slots_lock:
+            return self._host_slots.setdefault(host, threading.BoundedSemaphore(HOST_CONCURRENCY))
+    
+    def _search_on_host(self, host: str, search, *args) -> List[Dict]:
+        """Run one search call while holding a concurrency slot for its host"""
+        with self._host_slot(host):
+            return search(*args)
+    
     def search_all_sources(self, serpapi_key: Optional[str] = None) -> List[Dict]:
         """Search all available job sources"""
-        all_jobs = []
+        # Jobs are deduplicated by URL as each source's results are merged
+        seen_urls: Set[str] = set()
+        unique_jobs = []
+        total_jobs = 0
+        # Job URLs taken from listings by any keyword sweep of this run. Kept local: the
+        # webhook, /jobs/search and /debug/search can all run on this instance at once
+        crawled_urls: Set[str] = set()
         
         # Optimize: For Drushim and GotFriends, location doesn't affect the URL
         # So we only need to search once per unique search term, not per keyword×location
         # This reduces 20 searches (4 keywords × 5 locations) to just 4 searches
         
-        # Get unique search terms for Drushim/GotFriends (they use the same category)
-        unique_search_terms = set()
-        for keyword in self.search_keywords:
-            keyword_lower = keyword.lower().strip()
-            if 'devsecops' in keyword_lower or 'dev sec ops' in keyword_lower:
-                unique_search_terms.add('devsecops')
-            elif 'devops' in keyword_lower:
-                unique_search_terms.add('devops')
-            elif 'sre' in keyword_lower:
-                unique_search_terms.add('sre')
-            elif 'cloud' in keyword_lower:
-                unique_search_terms.add('cloud')
-            else:
-                unique_search_terms.add(keyword_lower)
+        # Get unique search terms for Drushim/GotFriends (they use the same category),
+        # using the same variant table as the per-source URL lookups
+        unique_search_terms = {_canonical_keyword(keyword) for keyword in self.search_keywords}
         
         logger.info(f"Optimized search: Searching {len(unique_search_terms)} unique terms instead of {len(self.search_keywords) * len(self.locations)} keyword×location combinations")
         
-        # Search Drushim once per unique search term
+        # Every search call is an independent network round-trip, so fan them all out at once
+        # and bound them per host instead of running each source sequentially. Drushim batches
+        # its own listing/job page fetches, each taking a drushim host slot; GotFriends is
+        # searched once per distinct category page. Results are merged in submission order so
+        # the first job seen for a URL still wins.
+        gotfriends_terms = {}
         for search_term in unique_search_terms:
-            logger.info(f"Searching Drushim for '{search_term}'")
-            drushim_jobs = self.search_drushim(search_term, "Israel")
-            all_jobs.extend(drushim_jobs)
-            time.sleep(1)  # Reduced delay since we're doing fewer searches
+            gotfriends_terms.setdefault(GOTFRIENDS_URLS.get(_canonical_keyword(search_term), GOTFRIENDS_DEFAULT_URL), search_term)
         
-        # Search GotFriends once per unique search term
-        for search_term in unique_search_terms:
-            logger.info(f"Searching GotFriends for '{search_term}'")
-            gotfriends_jobs = self.search_gotfriends(search_term, "Israel")
-            all_jobs.extend(gotfriends_jobs)
-            time.sleep(1)  # Reduced delay
-        
-        # For SerpAPI, we still search per keyword×location (if provided)
-        # as it may have location-specific results
-        if serpapi_key:
-            logger.info(f"SerpAPI key provided - searching Google Jobs via SerpAPI")
-            logger.info(f"This will perform {len(self.search_keywords) * len(self.locations)} SerpAPI searches ({len(self.search_keywords)} keywords × {len(self.locations)} locations)")
-            for keyword in self.search_keywords:
-                for location in self.locations:
-                    serpapi_jobs = self.search_serpapi(serpapi_key, keyword, location)
-                    all_jobs.extend(serpapi_jobs)
-                    time.sleep(1)  # Delay to avoid rate limiting
-        else:
-            logger.info("SerpAPI key not provided - skipping Google Jobs search (add SERPAPI_KEY to .env to enable)")
-        
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_jobs = []
-        for job in all_jobs:
-            if job.get('url') and job['url'] not in seen_urls:
-                seen_urls.add(job['url'])
-                unique_jobs.append(job)
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix='jobsource') as executor:
+            futures = [executor.submit(self.collect_drushim, unique_search_terms, "Israel", crawled_urls)]
+            for search_term in gotfriends_terms.values():
+                logger.info(f"Searching GotFriends for '{search_term}'")
+                futures.append(executor.submit(self._search_on_host, 'www.gotfriends.co.il', self.search_gotfriends, search_term, "Israel", crawled_urls))
+            
+            # For SerpAPI, we still search per keyword×location (if provided)
+            # as it may have location-specific results
+            if serpapi_key:
+                logger.info(f"SerpAPI key provided - searching Google Jobs via SerpAPI")
+                logger.info(f"This will perform {len(self.search_keywords) * len(self.locations)} SerpAPI searches ({len(self.search_keywords)} keywords × {len(self.locations)} locations)")
+                for keyword in self.search_keywords:
+                    for location in self.locations:
+                        futures.append(executor.submit(self._search_on_host, 'serpapi.com', self.search_serpapi, serpapi_key, keyword, location))
+            else:
+                logger.info("SerpAPI key not provided - skipping Google Jobs search (add SERPAPI_KEY to .env to enable)")
+            
+            for future in futures:
+                jobs = future.result()
+                total_jobs += len(jobs)
+                for job in jobs:
+                    url = job.get('url')
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        unique_jobs.append(job)
         
-        logger.info(f"Total unique jobs found: {len(unique_jobs)} (from {len(all_jobs)} total before deduplication)")
+        logger.info(f"Total unique jobs found: {len(unique_jobs)} (from {total_jobs} total before deduplication)")
         return unique_jobs
     
     def _extract_company_from_title(self, title: str) -> str:
@@ -673,14 +958,22 @@ class JobSearch:
             from dateutil import parser
             return parser.parse(date_string)
         except:
-            return datetime.utcnow()
+            return _utcnow()
     
     def _parse_drushim_date(self, text: str) -> Optional[datetime]:
         """Parse posted date from Drushim page text (e.g., 'לפני 3 שעות' = '3 hours ago', 'לפני מספר דקות' = 'a few minutes ago')"""
+        if not text:
+            return None
+        age = self._parse_drushim_age(text)
+        return _utcnow() - age if age is not None else None
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_drushim_age(text: str) -> Optional[timedelta]:
+        """Parse how long ago a Drushim job was posted from its page text"""
+        # Memoized on the text alone: the same snippets ("לפני 3 שעות") repeat across jobs,
+        # and returning an age rather than a datetime keeps cached results valid over time
         try:
-            if not text:
-                return None
-                
             # Patterns for Hebrew time expressions
             # לפני X שעות = X hours ago
             # לפני X דקות = X minutes ago
@@ -690,60 +983,61 @@ class JobSearch:
             # לפני X שבועות = X weeks ago
             # Also check for date patterns like "02/11/2025"
             
+            # Scan once, keeping the first occurrence of each form; the checks below
+            # then apply the same precedence and limits as separate searches would
+            found = {}
+            for match in _DATE_RE.finditer(text):
+                found.setdefault(match.lastgroup, match)
+            if not found:
+                return None
+            
             # Check for "מספר דקות" (a few minutes) - very recent
-            few_minutes_pattern = r'לפני\s*מספר\s*דקות?'
-            if re.search(few_minutes_pattern, text, re.IGNORECASE):
+            if 'few_minutes' in found:
                 # Assume "a few minutes" means 5 minutes ago
-                return datetime.utcnow() - timedelta(minutes=5)
+                return timedelta(minutes=5)
             
             # Check for "מספר שעות" (a few hours)
-            few_hours_pattern = r'לפני\s*מספר\s*שעות?'
-            if re.search(few_hours_pattern, text, re.IGNORECASE):
+            if 'few_hours' in found:
                 # Assume "a few hours" means 2 hours ago
-                return datetime.utcnow() - timedelta(hours=2)
+                return timedelta(hours=2)
             
             # Check for specific number of minutes ago
-            minutes_pattern = r'לפני\s*(\d+)\s*דקות?'
-            minutes_match = re.search(minutes_pattern, text, re.IGNORECASE)
+            minutes_match = found.get('minutes')
             if minutes_match:
-                minutes = int(minutes_match.group(1))
+                minutes = int(minutes_match.group('minutes'))
                 # Accept any minutes (even if it's many, as long as it's reasonable)
                 if minutes < 10080:  # 7 days * 24 hours * 60 minutes
-                    return datetime.utcnow() - timedelta(minutes=minutes)
+                    return timedelta(minutes=minutes)
             
             # Check for specific number of hours ago (most common for recent jobs)
-            hours_pattern = r'לפני\s*(\d+)\s*שעות?'
-            hours_match = re.search(hours_pattern, text, re.IGNORECASE)
+            hours_match = found.get('hours')
             if hours_match:
-                hours = int(hours_match.group(1))
+                hours = int(hours_match.group('hours'))
                 # Accept hours up to 48 hours (to catch jobs from today even if posted early)
                 if hours < 48:
-                    return datetime.utcnow() - timedelta(hours=hours)
+                    return timedelta(hours=hours)
             
             # Check for "היום" (today) - explicitly today
-            today_pattern = r'היום'
-            if re.search(today_pattern, text, re.IGNORECASE):
+            if 'today' in found:
                 # If it says "today", return current time (or a few hours ago to be safe)
-                return datetime.utcnow() - timedelta(hours=2)
+                return timedelta(hours=2)
             
             # Check for days ago
-            days_pattern = r'לפני\s*(\d+)\s*ימים?'
-            days_match = re.search(days_pattern, text, re.IGNORECASE)
+            days_match = found.get('days')
             if days_match:
-                days = int(days_match.group(1))
+                days = int(days_match.group('days'))
                 if days == 0:
                     # "לפני 0 ימים" means today
-                    return datetime.utcnow() - timedelta(hours=2)
+                    return timedelta(hours=2)
                 elif days <= 7:
-                    return datetime.utcnow() - timedelta(days=days)
+                    return timedelta(days=days)
             
             # Check for weeks ago
-            weeks_pattern = r'לפני\s*(\d+)\s*שבועות?'
-            weeks_match = re.search(weeks_pattern, text, re.IGNORECASE)
+            weeks_match = found.get('weeks')
             if weeks_match:
-                weeks = int(weeks_match.group(1))
+                weeks = int(weeks_match.group('weeks'))
                 if weeks <= 2:
-                    return datetime.utcnow() - timedelta(weeks=weeks)
+                    return timedelta(weeks=weeks)
             
             # If no pattern matches, return None
             # The filter will check if we should include it based on other criteria
@@ -755,6 +1049,6 @@ class JobSearch:
     def _parse_serpapi_date(self, date_string: Optional[str]) -> Optional[datetime]:
         """Parse date from SerpAPI response"""
         if not date_string:
-            return datetime.utcnow()
+            return _utcnow()
         return self._parse_date(date_string)
 
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List, Dict
-from database import Database, Job
+from database import Database, utcnow
 from job_search import JobSearch
 from job_filter import JobFilter
 from telegram_bot import TelegramJobBot
@@ -34,6 +34,8 @@ class JobService:
         
         # Search all sources
         all_jobs = self.job_search.search_all_sources(Config.SERPAPI_KEY)
+        # Build each job's search text and parsed date once for all filter stages
+        self.job_filter.preprocess(all_jobs)
         logger.info(f"Found {len(all_jobs)} jobs from all sources")
         
         # Debug: Print sample jobs
@@ -51,7 +53,9 @@ class JobService:
             excluded = len(all_jobs) - len(filtered_jobs)
             logger.info(f"Excluded {excluded} jobs that didn't match keywords or experience requirements")
             # Log sample of excluded jobs for debugging
-            excluded_samples = [job for job in all_jobs if job not in filtered_jobs][:3]
+            # filter_jobs returns the same dicts it was given, so compare by identity
+            kept_ids = {id(job) for job in filtered_jobs}
+            excluded_samples = [job for job in all_jobs if id(job) not in kept_ids][:3]
             for job in excluded_samples:
                 logger.debug(f"Excluded job sample: '{job.get('title', '')[:50]}' - URL: {job.get('url', '')[:60]}")
         
@@ -63,10 +67,11 @@ class JobService:
         # Debug: Print job details
         if today_jobs:
             logger.info(f"\n✅ Jobs that passed all filters (will be sent to Telegram):")
+            now = utcnow()
             for i, job in enumerate(today_jobs[:10], 1):  # Show up to 10 jobs
                 posted = job.get('posted_date', 'No date')
                 if isinstance(posted, datetime):
-                    hours_ago = (datetime.utcnow() - posted).total_seconds() / 3600
+                    hours_ago = (now - posted).total_seconds() / 3600
                     posted_str = f"{posted.date()} ({hours_ago:.1f} hours ago)"
                 else:
                     posted_str = str(posted)
@@ -79,10 +84,11 @@ class JobService:
             if filtered_jobs:
                 logger.warning(f"  But {len(filtered_jobs)} jobs passed keyword/experience filters")
                 logger.warning(f"  Sample filtered jobs (older than 72 hours):")
+                now = utcnow()
                 for i, job in enumerate(filtered_jobs[:5], 1):
                     posted = job.get('posted_date', 'No date')
                     if isinstance(posted, datetime):
-                        hours_ago = (datetime.utcnow() - posted).total_seconds() / 3600
+                        hours_ago = (now - posted).total_seconds() / 3600
                         if hours_ago < 72:
                             posted_str = f"{posted.date()} ({hours_ago:.1f} hours ago - should be included!)"
                         else:
@@ -92,24 +98,22 @@ class JobService:
                         posted_str = str(posted)
                     logger.warning(f"    {i}. '{job.get('title', '')[:50]}' - Posted: {posted_str}")
         
-        # Save new jobs to database
-        new_jobs = []
-        duplicate_count = 0
-        for job in today_jobs:
-            saved_job = self.db.add_job(job)
-            if saved_job:
-                # Access all attributes immediately while the job object is still valid
-                # (even though it's expunged, the attributes are already loaded)
-                new_jobs.append({
-                    'title': job.get('title', ''),
-                    'company': job.get('company', ''),
-                    'location': job.get('location', ''),
-                    'url': job.get('url', ''),
-                    'description': job.get('description', ''),
-                    'source': job.get('source', 'unknown')
-                })
-            else:
-                duplicate_count += 1
+        # Save new jobs to database in one statement; duplicates are skipped by the database.
+        # The rows carry the job_id computed on insert, so marking them sent needs no rehash
+        inserted_rows, failed_count = self.db.add_jobs_bulk(today_jobs)
+        if failed_count:
+            # Unsaved, not duplicates - each failure was logged with its job by the database
+            logger.error(f"Failed to save {failed_count} jobs to database")
+        new_jobs = [{
+            'job_id': row['job_id'],
+            'title': row['title'],
+            'company': row['company'],
+            'location': row['location'],
+            'url': row['url'],
+            'description': row['description'],
+            'source': row['source']
+        } for row in inserted_rows]
+        duplicate_count = len(today_jobs) - len(new_jobs) - failed_count
         
         if duplicate_count > 0:
             logger.info(f"Skipped {duplicate_count} duplicate jobs (already in database)")
@@ -121,6 +125,7 @@ class JobService:
             'filtered': len(filtered_jobs),
             'today': len(today_jobs),
             'new': len(new_jobs),
+            'failed': failed_count,
             'jobs': new_jobs
         }
     
@@ -138,13 +143,7 @@ class JobService:
                 if success:
                     logger.info("Successfully sent jobs to Telegram, marking as sent in database")
                     # Mark jobs as sent
-                    for job in result['jobs']:
-                        job_id = Job.generate_job_id(
-                            job['url'],
-                            job['title'],
-                            job['company']
-                        )
-                        self.db.mark_job_as_sent(job_id)
+                    self.db.mark_jobs_as_sent_bulk([job['job_id'] for job in result['jobs']])
                     logger.info("All jobs marked as sent in database")
                 else:
                     logger.error("Failed to send jobs to Telegram")
@@ -1,16 +1,27 @@
 from telegram import Bot
 from telegram.constants import ParseMode
+from telegram.error import RetryAfter
 from typing import List, Dict
 import asyncio
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Jobs are packed into as few messages as possible; Telegram caps a message at 4096 characters
+MAX_MESSAGE_LENGTH = 4000
+JOB_SEPARATOR = "\n\n---\n\n"
+
 class TelegramJobBot:
     def __init__(self, bot_token: str, chat_id: str):
         self.bot_token = bot_token
         self.chat_id = chat_id
         self.bot = Bot(token=bot_token)
+        # The sync wrappers are called from the scheduler, Flask request threads and the
+        # search executor; they all run on one long-lived loop so the bot's HTTP client
+        # keeps its connections instead of being rebuilt on a fresh loop per call
+        self._loop = None
+        self._loop_lock = threading.Lock()
     
     async def send_jobs(self, jobs: List[Dict]) -> bool:
         """Send a list of jobs to Telegram"""
@@ -20,27 +31,14 @@ class TelegramJobBot:
         
         try:
             logger.info(f"Sending {len(jobs)} job(s) to Telegram chat {self.chat_id}")
-            # Send header message
-            header = f"🚀 *Found {len(jobs)} new job(s) today!*\n\n"
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=header,
-                parse_mode=ParseMode.MARKDOWN
-            )
-            logger.info("Sent header message to Telegram")
+            # The header leads the first message, then jobs are packed greedily
+            header = f"🚀 *Found {len(jobs)} new job(s) today!*"
+            messages = [self._format_job_message(job, i, len(jobs)) for i, job in enumerate(jobs, 1)]
+            chunks = self._pack_messages([header] + messages)
             
-            # Send each job
-            for i, job in enumerate(jobs, 1):
-                message = self._format_job_message(job, i, len(jobs))
-                await self.bot.send_message(
-                    chat_id=self.chat_id,
-                    text=message,
-                    parse_mode=ParseMode.MARKDOWN,
-                    disable_web_page_preview=False
-                )
-                logger.info(f"Sent job {i}/{len(jobs)} to Telegram: {job.get('title', '')[:50]}")
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.5)
+            for i, chunk in enumerate(chunks, 1):
+                await self._send_chunk(chunk)
+                logger.info(f"Sent message {i}/{len(chunks)} to Telegram")
             
             logger.info(f"Successfully sent all {len(jobs)} jobs to Telegram")
             return True
@@ -48,6 +46,40 @@ class TelegramJobBot:
             logger.error(f"Error sending jobs to Telegram: {e}", exc_info=True)
             return False
     
+    def _pack_messages(self, parts: List[str]) -> List[str]:
+        """Join message parts into as few chunks of at most MAX_MESSAGE_LENGTH characters as possible"""
+        chunks = []
+        current = ''
+        for part in parts:
+            if current and len(current) + len(JOB_SEPARATOR) + len(part) > MAX_MESSAGE_LENGTH:
+                chunks.append(current)
+                current = part
+            else:
+                current = f"{current}{JOB_SEPARATOR}{part}" if current else part
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    async def _send_chunk(self, text: str):
+        """Send one batched message, waiting out a flood-control response once"""
+        # Previews are off: a batch holds several job links and would otherwise show only the first
+        try:
+            await self.bot.send_message(
+                chat_id=self.chat_id,
+                text=text,
+                parse_mode=ParseMode.MARKDOWN,
+                disable_web_page_preview=True
+            )
+        except RetryAfter as e:
+            logger.warning(f"Telegram rate limit hit, retrying in {e.retry_after}s")
+            await asyncio.sleep(e.retry_after)
+            await self.bot.send_message(
+                chat_id=self.chat_id,
+                text=text,
+                parse_mode=ParseMode.MARKDOWN,
+                disable_web_page_preview=True
+            )
+    
     async def send_no_jobs_message(self) -> bool:
         """Send a message when no new jobs are found"""
         try:
@@ -107,33 +139,22 @@ class TelegramJobBot:
         
         return message
     
+    def _run(self, coro):
+        """Run a coroutine on the bot's event loop thread and wait for its result"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='telegram-loop', daemon=True).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
     def send_jobs_sync(self, jobs: List[Dict]) -> bool:
         """Synchronous wrapper for send_jobs"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_jobs(jobs))
+        return self._run(self.send_jobs(jobs))
     
     def send_no_jobs_sync(self) -> bool:
         """Synchronous wrapper for send_no_jobs_message"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_no_jobs_message())
+        return self._run(self.send_no_jobs_message())
     
     def send_notification_sync(self, message: str) -> bool:
         """Synchronous wrapper for send_notification"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        return loop.run_until_complete(self.send_notification(message))
-
+        return self._run(self.send_notification(message))
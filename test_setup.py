@@ -1,137 +1,210 @@
 #!/usr/bin/env python3
 """
-Test script to verify JobBot setup
+Test script to verify JobBot setup (run with: python test_setup.py or pytest test_setup.py,
+after pip install -r requirements-dev.txt)
+
+Run it serially: the tests share session fixtures and take milliseconds each, so
+pytest-xdist workers (-n 2 / -n 4) only add their own startup and imports
 """
+import importlib
+import os
+import subprocess
 import sys
+import uuid
+import pytest
+from sqlalchemy.pool import StaticPool
 
-def test_imports():
-    """Test if all required modules can be imported"""
-    print("Testing imports...")
+# Every application module; only test_imports loads the heavy ones (telegram, requests, bs4)
+MODULES = ("config", "database", "job_search", "job_filter", "telegram_bot", "job_service")
+
+# Wall-clock budget for importing all of MODULES in a fresh interpreter, in seconds
+IMPORT_BUDGET = 1.5
+
+def _require(name):
+    """Import an application module, skipping the calling test if it can't be imported"""
+    # test_imports reports the ImportError itself; the tests built on the module just skip
     try:
-        from config import Config
-        from database import Database, Job
-        from job_search import JobSearch
-        from job_filter import JobFilter
-        from telegram_bot import TelegramJobBot
-        from job_service import JobService
-        print("✓ All imports successful")
-        return True
+        return importlib.import_module(name)
     except ImportError as e:
-        print(f"✗ Import error: {e}")
-        return False
+        pytest.skip(f"{name} failed to import ({e}), see test_imports")
 
-def test_config():
-    """Test configuration"""
-    print("\nTesting configuration...")
-    try:
-        from config import Config
-        # Don't validate, just check if config loads
-        print(f"✓ Config loaded")
-        print(f"  - Search keywords: {Config.SEARCH_KEYWORDS}")
-        print(f"  - Experience levels: {Config.EXPERIENCE_LEVELS}")
-        print(f"  - Job keywords: {len(Config.JOB_KEYWORDS)} keywords")
-        print(f"  - Locations: {Config.SEARCH_LOCATIONS}")
-        
-        # Check if required env vars are set (but don't fail if they're not)
-        if Config.TELEGRAM_BOT_TOKEN and Config.TELEGRAM_BOT_TOKEN != 'your_telegram_bot_token_here':
-            print("  - Telegram bot token: ✓ Set")
-        else:
-            print("  - Telegram bot token: ✗ Not set (update .env file)")
-        
-        if Config.TELEGRAM_CHAT_ID and Config.TELEGRAM_CHAT_ID != 'your_telegram_chat_id_here':
-            print("  - Telegram chat ID: ✓ Set")
-        else:
-            print("  - Telegram chat ID: ✗ Not set (update .env file)")
-        
-        if Config.SERPAPI_KEY:
-            print("  - SerpAPI key: ✓ Set (optional)")
-        else:
-            print("  - SerpAPI key: ✗ Not set (optional, but recommended)")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Config error: {e}")
-        return False
+@pytest.fixture(scope="session")
+def config():
+    """Load the configuration once for the whole test run"""
+    return _require("config").Config
 
-def test_database():
-    """Test database setup"""
-    print("\nTesting database...")
-    try:
-        from database import Database, Job
-        from config import Config
-        
-        db = Database(Config.DATABASE_URL)
-        print("✓ Database connection successful")
-        
-        # Test job_id generation
-        job_id = Job.generate_job_id("https://example.com/job", "Test Job", "Test Company")
-        print(f"✓ Job ID generation works: {job_id[:8]}...")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Database error: {e}")
-        return False
+@pytest.fixture(scope="session")
+def db():
+    """Open the database once for the whole test run"""
+    database = _require("database")
+    # In-memory by default so the run never touches the configured DATABASE_URL
+    url = os.environ.get("JOBBOT_TEST_DB_URL", "sqlite:///:memory:")
+    if url.startswith("sqlite") and ":memory:" in url:
+        # StaticPool keeps one connection for the whole run, so every thread and session
+        # sees the same in-memory database instead of a fresh empty one
+        return database.Database(url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    # Any other override runs with the production engine settings
+    return database.Database(url)
 
-def test_job_filter():
-    """Test job filtering"""
-    print("\nTesting job filter...")
-    try:
-        from job_filter import JobFilter
-        from config import Config
-        
-        job_filter = JobFilter(Config.EXPERIENCE_LEVELS, Config.JOB_KEYWORDS)
-        
-        # Test job that should match
-        test_job = {
-            'title': 'Junior DevOps Engineer',
-            'company': 'Tech Corp',
-            'description': 'Looking for a junior DevOps engineer with AWS, Docker, and Jenkins experience. 0-2 years required.',
-            'location': 'Remote'
-        }
-        
-        matches = job_filter.filter_job(test_job)
-        print(f"✓ Job filter works: Test job matches = {matches}")
-        
-        return True
-    except Exception as e:
-        print(f"✗ Job filter error: {e}")
-        return False
+@pytest.fixture(scope="session", params=["automaton", "find"])
+def job_filter(config, request):
+    """Build the job filter once per keyword matching path for the whole test run"""
+    job_filter_module = _require("job_filter")
+    if request.param == "automaton":
+        # The production path: literal keywords compiled into one Aho-Corasick automaton
+        if job_filter_module.ahocorasick is None:
+            pytest.skip("pyahocorasick not installed")
+        job_filter = job_filter_module.JobFilter(config.EXPERIENCE_LEVELS, config.JOB_KEYWORDS)
+        assert job_filter._keyword_automaton is not None
+        return job_filter
+    # The fallback used without pyahocorasick must give the same answers
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(job_filter_module, "ahocorasick", None)
+        return job_filter_module.JobFilter(config.EXPERIENCE_LEVELS, config.JOB_KEYWORDS)
 
-def main():
-    """Run all tests"""
-    print("JobBot Setup Test\n" + "=" * 50)
+def test_imports(subtests):
+    """Test if all required modules can be imported"""
+    # A failed import never stays in sys.modules, so modules already loaded by earlier
+    # tests are known to import fine (None entries are blocked imports, not successes)
+    if all(sys.modules.get(name) is not None for name in MODULES):
+        return
+    # One subtest per module, so a broken import doesn't hide the state of the others
+    for name in MODULES:
+        with subtests.test(module=name):
+            importlib.import_module(name)
+
+def test_import_budget():
+    """Test that importing the whole application stays within IMPORT_BUDGET"""
+    if os.environ.get("JOBBOT_SKIP_PERF") == "1":
+        pytest.skip("JOBBOT_SKIP_PERF=1")
+    # Measured in a fresh interpreter - in this process the modules may already be cached.
+    # To see which import is slow: python -X importtime -c "import job_service" 2> import.log
+    code = (
+        "import importlib, time\n"
+        "start = time.perf_counter()\n"
+        f"for name in {MODULES!r}:\n"
+        "    importlib.import_module(name)\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0, result.stderr
+    elapsed = float(result.stdout.strip().splitlines()[-1])
+    assert elapsed < IMPORT_BUDGET, f"importing {len(MODULES)} modules took {elapsed:.2f}s (budget {IMPORT_BUDGET}s)"
+
+def test_config(config, subtests):
+    """Test configuration"""
+    # Don't validate, just check if config loads
+    # (Telegram and SerpAPI credentials may legitimately be unset here)
+    for name in ("SEARCH_KEYWORDS", "EXPERIENCE_LEVELS", "JOB_KEYWORDS", "SEARCH_LOCATIONS"):
+        with subtests.test(setting=name):
+            value = getattr(config, name)
+            # Parsed once at import into an immutable tuple, not re-split on every access
+            assert isinstance(value, tuple)
+            assert value
+
+def test_database(db):
+    """Test database setup"""
+    Job = _require("database").Job
+    
+    # Test job_id generation
+    job_id = Job.generate_job_id("https://example.com/job", "Test Job", "Test Company")
+    # BLAKE2b-128 hex digest
+    assert len(job_id) == 32
+    int(job_id, 16)
     
-    tests = [
-        test_imports,
-        test_config,
-        test_database,
-        test_job_filter
-    ]
+    # Repeated jobs are answered from the cache instead of being rehashed
+    hits = Job.generate_job_id.cache_info().hits
+    assert Job.generate_job_id("https://example.com/job", "Test Job", "Test Company") == job_id
+    assert Job.generate_job_id.cache_info().hits == hits + 1
     
-    results = []
-    for test in tests:
-        try:
-            result = test()
-            results.append(result)
-        except Exception as e:
-            print(f"✗ Test failed with exception: {e}")
-            results.append(False)
+    # Inserts go through the engine, reads through a scoped session - both must see the same database
+    # (unique URL so a file-backed JOBBOT_TEST_DB_URL can be reused across runs)
+    job = {'url': f"https://example.com/job/{uuid.uuid4().hex}", 'title': 'Test Job', 'company': 'Test Company'}
+    inserted, failed = db.add_jobs_bulk([job])
+    assert len(inserted) == 1 and failed == 0
+    assert db.add_jobs_bulk([job]) == ([], 0)
+    assert db.job_exists(inserted[0]['job_id'])
     
-    print("\n" + "=" * 50)
-    print(f"Tests passed: {sum(results)}/{len(results)}")
+    # The same job twice in one batch (e.g. listed by two sources) is inserted and returned once
+    twice = {**job, 'url': f"{job['url']}/twice"}
+    inserted, failed = db.add_jobs_bulk([twice, dict(twice)])
+    assert len(inserted) == 1 and failed == 0
     
-    if all(results):
-        print("✓ All tests passed! Setup looks good.")
-        print("\nNext steps:")
-        print("1. Update .env file with your Telegram bot token and chat ID")
-        print("2. (Optional) Add SerpAPI key for enhanced job search")
-        print("3. Run: python main.py (for manual testing)")
-        print("4. Run: python app.py (to start the web server for n8n)")
-        return 0
-    else:
-        print("✗ Some tests failed. Please check the errors above.")
-        return 1
+    # One bad row (here a NOT NULL title) among good ones only fails itself, and is
+    # counted as failed rather than as a duplicate
+    good = [{**job, 'url': f"{job['url']}/good{i}"} for i in range(2)]
+    bad = {**job, 'url': f"{job['url']}/bad", 'title': None}
+    inserted, failed = db.add_jobs_bulk([good[0], bad, good[1]])
+    assert [row['url'] for row in inserted] == [good[0]['url'], good[1]['url']]
+    assert failed == 1
+    assert all(db.job_exists(row['job_id']) for row in inserted)
 
-if __name__ == '__main__':
-    sys.exit(main())
+@pytest.mark.parametrize("job,expected", [
+    ({
+        'title': 'Junior DevOps Engineer',
+        'company': 'Tech Corp',
+        'description': 'Looking for a junior DevOps engineer with AWS, Docker, and Jenkins experience. 0-2 years required.',
+        'location': 'Remote'
+    }, True),
+    ({
+        'title': 'Platform Engineer',
+        'company': 'Startup',
+        'description': 'Python and Linux scripting, no experience required.',
+        'location': 'Remote'
+    }, True),
+    ({
+        'title': "מהנדס DevOps ג'וניור",
+        'company': 'חברה',
+        'description': 'עבודה עם Docker ו-Kubernetes',
+        'location': 'תל אביב'
+    }, True),
+    # No experience requirement mentioned - not blocked
+    ({
+        'title': 'DevOps Engineer',
+        'company': 'Tech Corp',
+        'description': 'Jenkins pipelines and Kubernetes clusters.',
+        'location': 'Remote'
+    }, True),
+    # Keywords that a whitespace-token lookup would miss: a multi-word variant and
+    # one glued to punctuation
+    ({
+        'title': 'Build Engineer',
+        'company': 'Tech Corp',
+        'description': 'Build and run our continuous integration setup.',
+        'location': 'Remote'
+    }, True),
+    ({
+        'title': 'Build Engineer',
+        'company': 'Tech Corp',
+        'description': 'Own the build (Jenkins/Terraform), entry level welcome.',
+        'location': 'Remote'
+    }, True),
+    ({
+        'title': 'Senior Cloud Architect',
+        'company': 'Big Corp',
+        'description': 'Own our AWS landing zone. 7+ years of experience required.',
+        'location': 'Tel Aviv'
+    }, False),
+    ({
+        'title': 'Site Reliability Engineer',
+        'company': 'Tech Corp',
+        'description': 'Docker and Terraform, 5 years of experience.',
+        'location': 'Remote'
+    }, False),
+    # No required keyword at all
+    ({
+        'title': 'Sales Manager',
+        'company': 'Retail Co',
+        'description': 'Grow our customer base across the region.',
+        'location': 'Haifa'
+    }, False),
+], ids=['junior', 'no-experience', 'hebrew-junior', 'unspecified', 'multi-word', 'punctuation', 'senior', 'five-years', 'off-topic'])
+def test_job_filter(job_filter, job, expected):
+    """Test job filtering"""
+    # filter_job caches its search text on the dict, so give it a copy of the case
+    assert job_filter.filter_job(dict(job)) == expected
 
+if __name__ == '__main__':
+    # -x: stop at the first failure, the later checks build on the earlier ones
+    sys.exit(pytest.main([__file__, "-q", "-x"]))